@@ -2,3 +2,7 @@
 
 TOOL_CONFIG_COMMAND = "config_command"
 TOOL_SHOW_COMMAND = "show_command"
+
+# Single tool outputs below this size are returned verbatim by the response node
+# instead of being sent back through the LLM for summarization.
+RAW_OUTPUT_PASSTHROUGH_CHARS = 2048
@@ -1,5 +1,6 @@
 """Node functions for the network automation agent workflow."""
 
+import json
 import logging
 import uuid
 from typing import Any, Dict
@@ -8,17 +9,23 @@ from langchain_core.messages import AIMessage, ToolMessage
 from langgraph.prebuilt import ToolNode
 from langgraph.types import interrupt
 
-from agent.constants import TOOL_CONFIG_COMMAND, TOOL_SHOW_COMMAND
+from agent.constants import (
+    RAW_OUTPUT_PASSTHROUGH_CHARS,
+    TOOL_CONFIG_COMMAND,
+    TOOL_SHOW_COMMAND,
+)
 from agent.schemas import ActionType, AgentResponse, ExecutionPlan
 from agent.state import RESUME_APPROVED
 
 logger = logging.getLogger(__name__)
 
 
-def execute_node(state: Dict[str, Any], tools: list) -> Dict[str, Any]:
-    """Execute node for running network automation tools."""
-    # Create ToolNode with error handling
-    tool_node = ToolNode(tools, handle_tool_errors=True)
+def execute_node(state: Dict[str, Any], tool_node: ToolNode) -> Dict[str, Any]:
+    """Execute node for running network automation tools.
+
+    The ToolNode is built once per workflow. It dispatches all tool calls of a
+    turn concurrently on a thread pool and returns ToolMessages in call order.
+    """
     # Delegate to LangGraph's ToolNode
     return tool_node.invoke(state)
 
@@ -33,11 +40,12 @@ def approval_node(state: Dict[str, Any]) -> Dict[str, Any] | None:
     last_msg = messages[-1]
 
     # Check for tool calls
-    if not hasattr(last_msg, "tool_calls") or not last_msg.tool_calls:
+    tool_calls = getattr(last_msg, "tool_calls", None)
+    if not tool_calls:
         return None
 
     # Identify sensitive calls (config_command)
-    sensitive_calls = [tc for tc in last_msg.tool_calls if tc["name"] == TOOL_CONFIG_COMMAND]
+    sensitive_calls = [tc for tc in tool_calls if tc["name"] == TOOL_CONFIG_COMMAND]
 
     if not sensitive_calls:
         return None
@@ -131,14 +139,25 @@ def understanding_node(
         # Fallback if both steps and response are empty
         return {"messages": [AIMessage(content="How can I help you with your network?")]}
 
+    # Consecutive READ steps on the same device share one show_command call (one SSH
+    # session); any other step ends the batch, so plan order is kept
+    read_batch = None
+
     for step in plan.steps:
         tool_name = ""
         args = {}
 
         if step.action_type == ActionType.READ:
+            if read_batch is not None and read_batch["devices"] == [step.device]:
+                if isinstance(read_batch["command"], str):
+                    read_batch["command"] = [read_batch["command"]]
+                read_batch["command"].append(step.command)
+                continue
             tool_name = TOOL_SHOW_COMMAND
             args = {"devices": [step.device], "command": step.command}
+            read_batch = args
         elif step.action_type == ActionType.CONFIGURE:
+            read_batch = None
             tool_name = TOOL_CONFIG_COMMAND
             # Ensure config is a list
             cmd_list = step.command.split("\n") if "\n" in step.command else [step.command]
@@ -159,6 +178,69 @@ def understanding_node(
     return {"messages": [AIMessage(content="", tool_calls=tool_calls)]}
 
 
+def _shared_device_error(tool_messages: list) -> str | None:
+    """Return the error message if every targeted device failed with the same error."""
+    errors = set()
+    for msg in tool_messages:
+        try:
+            payload = json.loads(msg.content)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+
+        # Global error (e.g. devices not found in inventory)
+        if "error" in payload and "devices" not in payload:
+            errors.add(str(payload["error"]))
+            continue
+
+        devices = payload.get("devices")
+        if not isinstance(devices, dict) or not devices:
+            return None
+        for result in devices.values():
+            if not isinstance(result, dict) or result.get("success", True):
+                return None
+            errors.add(str(result.get("error")))
+
+    return errors.pop() if len(errors) == 1 else None
+
+
+def _render_device_output(content) -> str | None:
+    """Render a tool's JSON result as readable per-device CLI output.
+
+    Returns None when the payload is not the usual per-device envelope, so the
+    caller falls back to LLM summarization.
+    """
+    try:
+        payload = json.loads(content)
+    except (TypeError, ValueError):
+        return None
+    devices = payload.get("devices") if isinstance(payload, dict) else None
+    if not isinstance(devices, dict) or not devices:
+        return None
+
+    sections = []
+    for hostname, result in devices.items():
+        if not isinstance(result, dict):
+            return None
+        sections.append(f"### {hostname}")
+        if not result.get("success"):
+            sections.append(f"❌ {result.get('error')}")
+            continue
+
+        output = result.get("output")
+        # Batched show commands return one entry per command
+        entries = output if isinstance(output, list) else [{"output": output}]
+        for entry in entries:
+            if not isinstance(entry, dict) or not isinstance(entry.get("output"), str):
+                return None
+            if entry.get("command"):
+                sections.append(f"`{entry['command']}`")
+            sections.append(f"```\n{entry['output'].rstrip()}\n```")
+
+    return "\n".join(sections)
+
+
 def response_node(state: Dict[str, Any], llm_provider) -> Dict[str, Any]:
     """Formats the final response by combining LLM summary with raw data."""
     from langchain_core.messages import HumanMessage
@@ -179,12 +261,12 @@ def response_node(state: Dict[str, Any], llm_provider) -> Dict[str, Any]:
     last_tool_output_str = "No data found."
 
     # Iterate backwards to find tool outputs
-    found_tool_output = False
+    tool_messages = []
     for msg in reversed(messages):
         if isinstance(msg, HumanMessage):
             break
         if isinstance(msg, ToolMessage):
-            found_tool_output = True
+            tool_messages.append(msg)
             # Ignore error/denied messages if you wish
             if isinstance(msg.content, str) and msg.content.startswith("❌"):
                 last_tool_output_str += (
@@ -193,9 +275,35 @@ def response_node(state: Dict[str, Any], llm_provider) -> Dict[str, Any]:
                 continue
             last_tool_output_str += f"\nOutput from {getattr(msg, 'name', 'tool')}: {msg.content}"
 
-    if not found_tool_output:
+    if not tool_messages:
+        last_msg = messages[-1] if messages else None
+        if isinstance(last_msg, AIMessage) and not getattr(last_msg, "tool_calls", None):
+            # Nothing was executed and the AI already answered - no need to summarize
+            logger.info("ResponseNode found no tool calls, skipping LLM summarization.")
+            return {"messages": []}
         logger.warning("ResponseNode ran but found no tool outputs in recent history.")
 
+    # Every device failed with the same error (bad credentials, unreachable network):
+    # report it directly, an LLM summary adds nothing and invites a retry.
+    shared_error = _shared_device_error(tool_messages)
+    if shared_error:
+        logger.info("All devices failed with the same error, skipping LLM summarization.")
+        return {"messages": [AIMessage(content=f"❌ Execution failed: {shared_error}")]}
+
+    # Small single outputs (e.g. 'show version' on one device) are shown as CLI text,
+    # saving a second LLM round trip that adds latency for little benefit.
+    if len(tool_messages) == 1:
+        raw_output = tool_messages[0].content
+        if (
+            isinstance(raw_output, str)
+            and not raw_output.startswith("❌")
+            and len(raw_output) < RAW_OUTPUT_PASSTHROUGH_CHARS
+        ):
+            rendered = _render_device_output(raw_output)
+            if rendered is not None:
+                logger.info("Tool output is small, skipping LLM summarization.")
+                return {"messages": [AIMessage(content=rendered)]}
+
     # 3. Generate Structured Response using Pydantic
     prompt = NetworkAgentPrompts.RESPONSE_PROMPT.invoke(
         {"user_query": user_query, "data": last_tool_output_str[:25000]}
@@ -6,6 +6,7 @@ from functools import partial
 # Changed: Use In-Memory checkpointer instead of SQLite
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
+from langgraph.prebuilt import ToolNode
 from langgraph.types import StateSnapshot
 
 from agent.constants import TOOL_CONFIG_COMMAND
@@ -34,7 +35,6 @@ from core.task_executor import TaskExecutor
 
 # Import monitoring components
 from monitoring.callbacks import AlertingCallbackHandler
-from monitoring.tracing import get_callback_handler
 
 logger = logging.getLogger(__name__)
 
@@ -72,9 +72,10 @@ class NetworkAgentWorkflow:
             device_inventory=self._device_inventory,
             tools=self._tools,
         )
+        # Build the ToolNode once; it runs independent tool calls concurrently
         execute_with_deps = partial(
             execute_func,
-            tools=self._tools,
+            tool_node=ToolNode(self._tools, handle_tool_errors=True),
         )
         response_with_deps = partial(
             response_func,
@@ -158,14 +159,14 @@ class NetworkAgentWorkflow:
         last_message = state["messages"][-1]
 
         # If no tool calls, it's a direct conversational response -> END
-        if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
+        tool_calls = getattr(last_message, "tool_calls", None)
+        if not tool_calls:
             return END
 
         # Intelligent Batch Routing:
         # Check ALL tool calls in the list.
         # If ANY tool call is a config command, route to APPROVAL.
         # Otherwise (all are show commands), route to EXECUTE.
-        tool_calls = last_message.tool_calls
         if any(tc["name"] == TOOL_CONFIG_COMMAND for tc in tool_calls):
             return NODE_APPROVAL
 
@@ -175,8 +175,9 @@ class NetworkAgentCLI:
         last_msg = messages[-1]
 
         # Check for final_response tool call
-        if hasattr(last_msg, "tool_calls") and last_msg.tool_calls:
-            for tool_call in last_msg.tool_calls:
+        tool_calls = getattr(last_msg, "tool_calls", None)
+        if tool_calls:
+            for tool_call in tool_calls:
                 if tool_call["name"] == "final_response":
                     self.components["ui"].print_output(tool_call["args"])
                     return
@@ -22,7 +22,9 @@ class AppBootstrapper:
         # Initialize in dependency order
         self._objects["nornir"] = NornirManager(self.config)
         self._objects["inventory"] = DeviceInventory(self._objects["nornir"])
-        self._objects["executor"] = TaskExecutor(self._objects["nornir"])
+        self._objects["executor"] = TaskExecutor(
+            self._objects["nornir"], read_timeout=self.config.netmiko_read_timeout
+        )
         self._objects["llm"] = LLMProvider(self.config, enable_monitoring=True)
         # Create tools registry (tools will obtain runtime dependencies via InjectedState)
         self._objects["tools"] = create_tools(self._objects["executor"])
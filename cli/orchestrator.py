@@ -18,9 +18,6 @@ from agent.state import (
 )
 from ui.console_ui import Emoji
 
-# Import monitoring components
-from monitoring.callbacks import AlertingCallbackHandler
-
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +35,8 @@ class NetworkAgentConfig:
         "NETMIKO_TIMEOUT": ("netmiko_timeout", int, 30),
         "NETMIKO_CONN_TIMEOUT": ("netmiko_conn_timeout", int, 10),
         "NETMIKO_SESSION_TIMEOUT": ("netmiko_session_timeout", int, 60),
+        "NETMIKO_READ_TIMEOUT": ("netmiko_read_timeout", int, 10),
+        "CONN_POOL_IDLE_TIMEOUT": ("conn_pool_idle_timeout", int, 300),
         "LOG_LEVEL": ("log_level", str, "INFO"),
         "LOG_FILE": ("log_file", str, "network_agent.log"),
         "INVENTORY_PATH": ("inventory_path", str, "hosts.yaml"),
@@ -51,6 +53,8 @@ class NetworkAgentConfig:
     netmiko_timeout: int = 30
     netmiko_conn_timeout: int = 10
     netmiko_session_timeout: int = 60
+    netmiko_read_timeout: int = 10
+    conn_pool_idle_timeout: int = 300  # Reopen cached device sessions idle longer than this
     log_level: str = "INFO"
     log_file: str = "network_agent.log"
     inventory_path: str = "hosts.yaml"
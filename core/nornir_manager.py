@@ -4,13 +4,19 @@ This module provides the NornirManager class that handles Nornir
 initialization and lifecycle management.
 """
 
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
 from nornir import InitNornir
 from nornir.core.inventory import Host
 from nornir.core.configuration import Config
-from nornir.core.task import Result
 
 from core.config import NetworkAgentConfig
 
+logger = logging.getLogger(__name__)
+
 
 class NornirManager:
     """Manages Nornir instance lifecycle and configuration.
@@ -29,6 +35,11 @@ class NornirManager:
         """
         self._config = config
         self._nornir = None
+        # Last time a task finished with each host's cached connection
+        self._last_used: dict[str, float] = {}
+        # Number of running tasks using each host's cached connection
+        self._in_flight: dict[str, int] = {}
+        self._conn_lock = threading.Lock()
 
     @property
     def nornir(self):
@@ -69,7 +80,6 @@ class NornirManager:
                         "session_timeout": 60,
                         "keepalive": 30,
                         "fast_cli": True,
-                        "global_cmd_verify": False,
                         "auto_connect": True
                     }
                 }
@@ -110,6 +120,68 @@ class NornirManager:
 
         return filtered_nornir
 
+    @contextmanager
+    def reserve_connections(self, hostnames: list[str]):
+        """Mark hosts as in use by a task, first closing their stale cached sessions.
+
+        Nornir keeps one open connection per host and reuses it for every task,
+        so a session dropped by the device would fail the next command. Closed
+        sessions are reopened on demand by the next task. A host another task is
+        still using is not probed, since the liveness check writes to the same
+        channel that task may be reading from.
+
+        Args:
+            hostnames: Hosts about to be used by a task
+        """
+        hosts = self.get_hosts()
+
+        # Only bookkeeping happens under the lock; probing a slow device must not
+        # hold up tasks for other devices
+        with self._conn_lock:
+            idle_since = {
+                hostname: self._last_used.get(hostname)
+                for hostname in hostnames
+                if hostname not in self._in_flight
+            }
+            for hostname in hostnames:
+                self._in_flight[hostname] = self._in_flight.get(hostname, 0) + 1
+        try:
+            # These hosts are now marked in flight, so no other task probes them
+            for hostname, last_used in idle_since.items():
+                host = hosts.get(hostname)
+                if host is not None and "netmiko" in host.connections:
+                    self._release_stale_connection(hostname, host, last_used)
+            yield
+        finally:
+            now = time.monotonic()
+            with self._conn_lock:
+                for hostname in hostnames:
+                    self._last_used[hostname] = now
+                    if self._in_flight.get(hostname, 0) > 1:
+                        self._in_flight[hostname] -= 1
+                    else:
+                        self._in_flight.pop(hostname, None)
+
+    def _release_stale_connection(self, hostname: str, host: Host, last_used: float | None) -> None:
+        """Close the host's cached session if it has been idle too long or is dead."""
+        try:
+            idle = (
+                last_used is not None
+                and time.monotonic() - last_used > self._config.conn_pool_idle_timeout
+            )
+            if idle or not host.connections["netmiko"].connection.is_alive():
+                logger.debug("Closing stale connection to %s", hostname)
+                host.close_connection("netmiko")
+        except Exception as e:
+            # The session is unusable either way; close what is left of the
+            # transport, then drop it so the next task reconnects
+            logger.debug("Discarding broken connection to %s: %s", hostname, e)
+            try:
+                host.close_connection("netmiko")
+            except Exception:
+                pass
+            host.connections.pop("netmiko", None)
+
     def close(self) -> None:
         """Close Nornir instance and cleanup resources.
 
@@ -118,6 +190,8 @@ class NornirManager:
         if self._nornir is not None:
             self._nornir.close_connections()
             self._nornir = None
+        self._last_used.clear()
+        self._in_flight.clear()
 
     def test_connectivity(self, hostnames: list[str] = None) -> dict[str, bool]:
         """Test connectivity to specified hosts or all hosts in inventory.
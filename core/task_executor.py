@@ -13,6 +13,7 @@ from netmiko.exceptions import (
     NetmikoAuthenticationException,
     NetmikoBaseException,
     NetmikoTimeoutException,
+    ReadTimeout,
 )
 
 from core.nornir_manager import NornirManager
@@ -27,13 +28,20 @@ class TaskExecutor:
     error handling and result processing.
     """
 
-    def __init__(self, nornir_manager: NornirManager):
+    def __init__(self, nornir_manager: NornirManager, read_timeout: int = 10):
         """Initialize the task executor.
 
         Args:
             nornir_manager: NornirManager instance
+            read_timeout: Seconds to wait for command output (Netmiko read_timeout)
         """
         self._nornir_manager = nornir_manager
+        self._read_timeout = read_timeout
+
+    @property
+    def read_timeout(self) -> int:
+        """Seconds to wait for command output before giving up on a device."""
+        return self._read_timeout
 
     def _execute_with_retry(self, nornir_instance, task_function, max_retries=3, **kwargs):
         """Execute Nornir task with retry logic for transient failures.
@@ -55,8 +63,10 @@ class TaskExecutor:
                 has_transient_failures = False
                 for hostname, result in results.items():
                     if result.failed:
-                        # Check if the failure is a timeout or connection issue that might be transient
+                        # Check if the failure is a timeout or connection issue that might be transient.
+                        # A ReadTimeout means the device answered too slowly; retrying only repeats the wait.
                         if (result.exception and
+                            not isinstance(result.exception, ReadTimeout) and
                             (isinstance(result.exception, (NetmikoTimeoutException, ConnectionError)) or
                              "timeout" in str(result.exception).lower() or
                              "connection" in str(result.exception).lower())):
@@ -68,14 +78,17 @@ class TaskExecutor:
                     return results
 
                 # If there are transient failures, log and retry after a delay
-                logger.warning(f"Transient failures detected, retrying in {2 ** attempt}s (attempt {attempt + 1}/{max_retries + 1})")
+                logger.warning(
+                    "Transient failures detected, retrying in %ss (attempt %s/%s)",
+                    2 ** attempt, attempt + 1, max_retries + 1,
+                )
                 time.sleep(2 ** attempt + random.uniform(0, 1))  # Exponential backoff with jitter
 
             except Exception as e:
                 if attempt == max_retries:
                     # If we've exhausted retries, re-raise the exception
                     raise e
-                logger.warning(f"Attempt {attempt + 1} failed with error: {e}, retrying in {2 ** attempt}s")
+                logger.warning("Attempt %s failed with error: %s, retrying in %ss", attempt + 1, e, 2 ** attempt)
                 time.sleep(2 ** attempt + random.uniform(0, 1))  # Exponential backoff with jitter
 
         # This should not be reached, but return results if needed
@@ -118,13 +131,6 @@ class TaskExecutor:
         # Normalize to set for consistent handling
         targets = {target_devices} if isinstance(target_devices, str) else set(target_devices)
 
-        # Get available hosts
-        available_hosts = set(self._nornir_manager.get_hosts().keys())
-
-        # Check for invalid devices
-        if invalid := targets - available_hosts:
-            return {"error": f"Devices not found: {sorted(invalid)}"}
-
         # Calculate optimal number of workers based on target devices
         num_targets = len(targets)
         # Use between 4 and 20 workers, or number of targets if less than 4
@@ -134,27 +140,32 @@ class TaskExecutor:
         try:
             filtered_nr = self._nornir_manager.filter_hosts(list(targets), num_workers=optimal_workers)
 
-            # CRITICAL: Check if we actually have hosts after filtering
-            if not filtered_nr.inventory.hosts:
-                return {"error": f"No valid hosts found in inventory matching: {targets}"}
-
-            # Pre-flight connectivity check
-            connectivity_results = self._nornir_manager.test_connectivity(list(targets))
-            unreachable = [host for host, is_reachable in connectivity_results.items() if not is_reachable]
-
-            if unreachable:
-                logger.warning(f"Unreachable devices detected: {unreachable}")
-                # Continue execution but warn - some devices might be temporarily unreachable
-                # In a production environment, you might want to fail fast instead
-                pass
-
-            # Execute with retry logic for transient failures
-            results = self._execute_with_retry(
-                nornir_instance=filtered_nr,
-                task_function=task_function,
-                max_retries=max_retries,
-                **kwargs
-            )
+            # The filtered inventory doubles as the existence check, so the full
+            # inventory is not scanned a second time; this also covers a filter
+            # that matched no hosts at all
+            if invalid := targets - filtered_nr.inventory.hosts.keys():
+                return {"error": f"Devices not found: {sorted(invalid)}"}
+
+            # Drop cached sessions the devices have already closed, and keep other
+            # tasks from probing them while this one is using them
+            with self._nornir_manager.reserve_connections(list(targets)):
+                # Pre-flight connectivity check
+                connectivity_results = self._nornir_manager.test_connectivity(list(targets))
+                unreachable = [host for host, is_reachable in connectivity_results.items() if not is_reachable]
+
+                if unreachable:
+                    logger.warning("Unreachable devices detected: %s", unreachable)
+                    # Continue execution but warn - some devices might be temporarily unreachable
+                    # In a production environment, you might want to fail fast instead
+                    pass
+
+                # Execute with retry logic for transient failures
+                results = self._execute_with_retry(
+                    nornir_instance=filtered_nr,
+                    task_function=task_function,
+                    max_retries=max_retries,
+                    **kwargs
+                )
 
             # STABILITY FIX: Add a small delay to allow device buffers/sessions to settle
             # This prevents "Prompt not detected" errors when hitting the same device rapidly
@@ -164,7 +175,7 @@ class TaskExecutor:
             return self._process_results(results)
 
         except Exception as e:
-            logger.error(f"Critical execution failure: {e}")
+            logger.error("Critical execution failure: %s", e)
             # Return a formatted error for ALL targets so the UI can show it
             return {dev: {"success": False, "output": None, "error": str(e)} for dev in targets}
 
@@ -218,6 +229,11 @@ class TaskExecutor:
         # Map Netmiko exceptions to user-friendly messages
         if isinstance(exception, NetmikoTimeoutException):
             return "Connection timed out. Check connectivity and firewall rules."
+        elif isinstance(exception, ReadTimeout):
+            return (
+                f"Timed out after {self._read_timeout}s waiting for command output. "
+                "The command may be slow or the prompt was not detected."
+            )
         elif isinstance(exception, NetmikoAuthenticationException):
             return "Authentication failed. Check device credentials."
         elif isinstance(exception, NetmikoBaseException):
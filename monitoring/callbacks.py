@@ -8,7 +8,6 @@ from enum import Enum
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
-from langchain_core.messages import BaseMessage
 
 logger = logging.getLogger(__name__)
 
@@ -277,15 +276,17 @@ class AlertingCallbackHandler(MonitoringCallbackHandler):
 
     def on_tool_end(self, output: str, **kwargs: Any) -> None:
         """Override to add alerting logic."""
+        # The base handler clears current_tool, so keep a reference to the finished record
+        tool = self.current_tool
         super().on_tool_end(output, **kwargs)
         
-        if self.current_tool and self.current_tool.duration:
+        if tool and tool.duration:
             # Check for slow tools
-            if (self.current_tool.duration > 
+            if (tool.duration > 
                 self.alert_thresholds.get("max_tool_duration", 30.0)):
                 alert_msg = (
-                    f"Slow tool execution: {self.current_tool.name} took "
-                    f"{self.current_tool.duration:.2f}s (threshold: "
+                    f"Slow tool execution: {tool.name} took "
+                    f"{tool.duration:.2f}s (threshold: "
                     f"{self.alert_thresholds['max_tool_duration']}s)"
                 )
                 self._trigger_alert(alert_msg, "performance")
@@ -300,15 +301,17 @@ class AlertingCallbackHandler(MonitoringCallbackHandler):
 
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Override to add alerting logic."""
+        # The base handler clears current_llm_call, so keep a reference to the finished record
+        llm_call = self.current_llm_call
         super().on_llm_end(response, **kwargs)
         
-        if self.current_llm_call and self.current_llm_call.duration:
+        if llm_call and llm_call.duration:
             # Check for slow LLM calls
-            if (self.current_llm_call.duration > 
+            if (llm_call.duration > 
                 self.alert_thresholds.get("max_llm_duration", 60.0)):
                 alert_msg = (
-                    f"Slow LLM call: {self.current_llm_call.model} took "
-                    f"{self.current_llm_call.duration:.2f}s (threshold: "
+                    f"Slow LLM call: {llm_call.model} took "
+                    f"{llm_call.duration:.2f}s (threshold: "
                     f"{self.alert_thresholds['max_llm_duration']}s)"
                 )
                 self._trigger_alert(alert_msg, "performance")
@@ -4,7 +4,6 @@ import logging
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-import json
 
 logger = logging.getLogger(__name__)
 
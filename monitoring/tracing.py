@@ -52,11 +52,6 @@ class LangSmithTracer:
         if not self.enabled:
             return workflow
 
-        # Import here to avoid circular imports
-        from langgraph.checkpoint.memory import MemorySaver
-        from langgraph.pregel import Pregel
-        import inspect
-
         # We need to recompile the workflow with tracing enabled
         # For now, return the original workflow and rely on callbacks
         return workflow
@@ -1,52 +1,118 @@
 """Integration tests for Network Agent Workflow."""
 
+import uuid
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
+
+pytest.importorskip("langgraph")
+
 from langchain_core.messages import HumanMessage
 
+from agent.schemas import AgentResponse
 from agent.workflow_manager import NetworkAgentWorkflow
-from core.device_inventory import DeviceInventory
-from core.llm_provider import LLMProvider
-from core.nornir_manager import NornirManager
-from core.task_executor import TaskExecutor
 from tools import create_tools
 
 
-@pytest.fixture
+# User turns are read-only inputs, so they are built once per module
+SHOW_VER_MSG = HumanMessage(content="show version on R1")
+CONFIG_MSG = HumanMessage(content="configure loopback")
+
+# Lightweight stand-in for a NetworkAction plan step
+Step = namedtuple("Step", "action_type device command")
+
+
+def _make_dispatch(response_llm, plan_llm):
+    """Route with_structured_output(schema) to the response or planner mock."""
+
+    def _dispatch(schema):
+        return response_llm if schema is AgentResponse else plan_llm
+
+    return _dispatch
+
+
+class _Stub:
+    """Minimal stand-in exposing only the methods the workflow calls."""
+
+    def reset_mock(self):
+        for attr in vars(self).values():
+            if isinstance(attr, MagicMock):
+                attr.reset_mock()
+
+
+class _StubNornirManager(_Stub):
+    def __init__(self):
+        self.get_hosts = MagicMock()
+
+
+class _StubDeviceInventory(_Stub):
+    def __init__(self):
+        self.get_device_info = MagicMock()
+        self.get_all_device_names = MagicMock()
+        self.validate_devices = MagicMock()
+
+
+class _StubTaskExecutor(_Stub):
+    def __init__(self):
+        self.read_timeout = 10
+        self.execute_task = MagicMock()
+
+
+class _StubLLMProvider(_Stub):
+    def __init__(self):
+        self._config = SimpleNamespace(max_history_tokens=1500)
+        self.get_llm = MagicMock()
+
+
+@pytest.fixture(scope="module")
 def mock_infrastructure():
-    """Setup mock infrastructure components."""
-    nornir_manager = MagicMock(spec=NornirManager)
-    device_inventory = MagicMock(spec=DeviceInventory)
-    task_executor = MagicMock(spec=TaskExecutor)
+    """Setup mock infrastructure components once per module."""
+    return {
+        "nornir_manager": _StubNornirManager(),
+        "device_inventory": _StubDeviceInventory(),
+        "task_executor": _StubTaskExecutor(),
+        "llm_provider": _StubLLMProvider(),
+    }
 
-    # Create LLMProvider mock with required _config attribute
-    llm_provider = MagicMock(spec=LLMProvider)
-    mock_config = MagicMock()
-    mock_config.max_history_tokens = 1500
-    llm_provider._config = mock_config
+
+@pytest.fixture(autouse=True)
+def reset_infrastructure(mock_infrastructure):
+    """Clear recorded calls between tests and restore the inventory responses."""
+    for name in ("nornir_manager", "device_inventory", "task_executor", "llm_provider"):
+        mock_infrastructure[name].reset_mock()
 
     # Setup device inventory
+    device_inventory = mock_infrastructure["device_inventory"]
     device_inventory.get_device_info.return_value = "R1 (cisco_ios)"
     device_inventory.get_all_device_names.return_value = ["R1"]
     device_inventory.validate_devices.return_value = ({"R1"}, set())
 
-    return {
-        "nornir_manager": nornir_manager,
-        "device_inventory": device_inventory,
-        "task_executor": task_executor,
-        "llm_provider": llm_provider,
-    }
 
+@pytest.fixture(scope="module")
+def tools(mock_infrastructure):
+    """Create the tool set once; schemas do not depend on the mocked executor state."""
+    return create_tools(mock_infrastructure["task_executor"])
 
-def test_workflow_show_command(mock_infrastructure):
+
+@pytest.fixture(scope="module")
+def built_graph(mock_infrastructure, tools):
+    """Compile the workflow graph once; tests isolate state with unique thread IDs."""
+    workflow = NetworkAgentWorkflow(
+        llm_provider=mock_infrastructure["llm_provider"],
+        device_inventory=mock_infrastructure["device_inventory"],
+        task_executor=mock_infrastructure["task_executor"],
+        tools=tools,
+    )
+    return workflow.build()
+
+
+def test_workflow_show_command(mock_infrastructure, built_graph):
     """Test end-to-end workflow for a show command."""
     task_executor = mock_infrastructure["task_executor"]
     llm_provider = mock_infrastructure["llm_provider"]
 
-    # Setup tools
-    tools = create_tools(task_executor)
-
     # Setup LLM responses
     mock_llm = MagicMock()
     llm_provider.get_llm.return_value = mock_llm
@@ -54,9 +120,7 @@ def test_workflow_show_command(mock_infrastructure):
     # Mock structured output for ExecutionPlan
     mock_execution_plan = MagicMock()
     mock_execution_plan.direct_response = None  # No direct response, will execute steps
-    mock_execution_plan.steps = [
-        MagicMock(action_type="read", device="R1", command="show version")
-    ]
+    mock_execution_plan.steps = [Step("read", "R1", "show version")]
     mock_structured_llm = MagicMock()
     mock_structured_llm.invoke.return_value = mock_execution_plan
     mock_llm.with_structured_output.return_value = mock_structured_llm
@@ -68,29 +132,17 @@ def test_workflow_show_command(mock_infrastructure):
     mock_response_structured_llm.invoke.return_value = mock_response_model
 
     # The response node also uses with_structured_output but for AgentResponse
-    def side_effect(schema):
-        if schema.__name__ == "AgentResponse":
-            return mock_response_structured_llm
-        return mock_structured_llm
-
-    mock_llm.with_structured_output.side_effect = side_effect
+    mock_llm.with_structured_output.side_effect = _make_dispatch(
+        mock_response_structured_llm, mock_structured_llm
+    )
 
     # Setup TaskExecutor response
     task_executor.execute_task.return_value = {"R1": "Cisco IOS Version 1.0"}
 
-    # Build workflow
-    workflow = NetworkAgentWorkflow(
-        llm_provider=llm_provider,
-        device_inventory=mock_infrastructure["device_inventory"],
-        task_executor=task_executor,
-        tools=tools,
-    )
-    graph = workflow.build()
-
     # Run workflow
-    result = graph.invoke(
-        {"messages": [HumanMessage(content="show version on R1")]},
-        {"configurable": {"thread_id": "test_session"}},
+    result = built_graph.invoke(
+        {"messages": [SHOW_VER_MSG]},
+        {"configurable": {"thread_id": f"test_{uuid.uuid4()}"}},
     )
 
     # Verify results
@@ -108,13 +160,11 @@ def test_workflow_show_command(mock_infrastructure):
     # Ensure we are NOT checking for 'structured_data' key
 
 
-def test_workflow_config_approval(mock_infrastructure):
+def test_workflow_config_approval(mock_infrastructure, built_graph):
     """Test workflow with configuration approval."""
     task_executor = mock_infrastructure["task_executor"]
     llm_provider = mock_infrastructure["llm_provider"]
 
-    tools = create_tools(task_executor)
-
     mock_llm = MagicMock()
     llm_provider.get_llm.return_value = mock_llm
     # llm_provider.get_llm_with_tools.return_value = mock_llm  # Not needed with new Planner
@@ -123,11 +173,7 @@ def test_workflow_config_approval(mock_infrastructure):
     mock_execution_plan = MagicMock()
     mock_execution_plan.direct_response = None  # No direct response, will execute steps
     mock_execution_plan.steps = [
-        MagicMock(
-            action_type="configure",
-            device="R1",
-            command="int lo0\nip addr 1.1.1.1 255.255.255.255",
-        )
+        Step("configure", "R1", "int lo0\nip addr 1.1.1.1 255.255.255.255")
     ]
     mock_structured_llm = MagicMock()
     mock_structured_llm.invoke.return_value = mock_execution_plan
@@ -142,26 +188,14 @@ def test_workflow_config_approval(mock_infrastructure):
     mock_response_structured_llm.invoke.return_value = mock_response_model
 
     # The response node also uses with_structured_output but for AgentResponse
-    def side_effect(schema):
-        if schema.__name__ == "AgentResponse":
-            return mock_response_structured_llm
-        return mock_structured_llm
-
-    mock_llm.with_structured_output.side_effect = side_effect
+    mock_llm.with_structured_output.side_effect = _make_dispatch(
+        mock_response_structured_llm, mock_structured_llm
+    )
 
     # Setup TaskExecutor response for config command
     task_executor.execute_task.return_value = {"R1": "Configuration applied"}
 
-    # Build workflow
-    workflow = NetworkAgentWorkflow(
-        llm_provider=llm_provider,
-        device_inventory=mock_infrastructure["device_inventory"],
-        task_executor=task_executor,
-        tools=tools,
-    )
-    graph = workflow.build()
-
-    config = {"configurable": {"thread_id": "test_session"}}
+    config = {"configurable": {"thread_id": f"test_{uuid.uuid4()}"}}
 
     # 1. Initial run - should stop at approval
     # We need to handle the interrupt. graph.invoke will raise GraphInterrupt if not handled?
@@ -176,12 +210,12 @@ def test_workflow_config_approval(mock_infrastructure):
     from langgraph.errors import GraphInterrupt
 
     try:
-        graph.invoke({"messages": [HumanMessage(content="configure loopback")]}, config)
+        built_graph.invoke({"messages": [CONFIG_MSG]}, config)
     except GraphInterrupt:
         pass
 
     # Check state - should be waiting for approval
-    snapshot = graph.get_state(config)
+    snapshot = built_graph.get_state(config)
     assert snapshot.next
     # The next node should be the one after approval?
     # Actually, the interrupt happens inside ApprovalNode or before ExecuteNode?
@@ -195,7 +229,7 @@ def test_workflow_config_approval(mock_infrastructure):
 
     from agent import RESUME_APPROVED
 
-    result = graph.invoke(Command(resume=RESUME_APPROVED), config)
+    result = built_graph.invoke(Command(resume=RESUME_APPROVED), config)
 
     # Verify tool execution
     task_executor.execute_task.assert_called_once()
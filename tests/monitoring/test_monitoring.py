@@ -1,6 +1,8 @@
 """Tests for the monitoring functionality of the Network Automation Agent."""
 
 import pytest
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -9,6 +11,9 @@ from monitoring.callbacks import MonitoringCallbackHandler, AlertingCallbackHand
 from monitoring.dashboard import MonitoringDashboard, PerformanceMetric
 from monitoring.alerting import AlertManager, Alert, AlertSeverity, AlertType
 
+# Lightweight stand-in for an LLMResult generation
+Gen = namedtuple("Gen", ["text", "message"])
+
 
 class TestLangSmithTracer:
     """Tests for LangSmith tracing functionality."""
@@ -71,8 +76,7 @@ class TestMonitoringCallbackHandler:
         handler.set_session_id("test-session")
         
         # Mock LLMResult
-        mock_result = Mock()
-        mock_result.generations = [[Mock(text="test response", message="test message")]]
+        mock_result = SimpleNamespace(generations=[[Gen("test response", "test message")]])
         
         # Simulate LLM start
         serialized = {"name": "gpt-3.5-turbo"}
@@ -99,8 +103,7 @@ class TestMonitoringCallbackHandler:
         handler.on_tool_end("output")
         
         handler.on_llm_start({"name": "gpt-3.5-turbo"}, ["prompt"])
-        mock_result = Mock()
-        mock_result.generations = [[Mock(text="response", message="message")]]
+        mock_result = SimpleNamespace(generations=[[Gen("response", "message")]])
         handler.on_llm_end(mock_result)
         
         stats = handler.get_session_stats()
@@ -115,17 +118,20 @@ class TestMonitoringCallbackHandler:
 class TestAlertingCallbackHandler:
     """Tests for alerting callback handler."""
 
-    def test_slow_tool_alert(self):
+    def test_slow_tool_alert(self, monkeypatch):
         """Test alerting for slow tool execution."""
-        thresholds = {"max_tool_duration": 0.001}  # 1ms threshold
+        thresholds = {"max_tool_duration": 0.5}  # 500ms threshold
         handler = AlertingCallbackHandler(alert_thresholds=thresholds)
         handler.set_session_id("test-session")
-        
+
+        # Controlled clock: every datetime.now() call advances one second
+        ticks = (datetime(2025, 1, 1, 12, 0, second) for second in range(60))
+        monkeypatch.setattr(
+            "monitoring.callbacks.datetime", Mock(now=lambda: next(ticks))
+        )
+
         # Simulate a slow tool
         handler.on_tool_start({"name": "slow_tool"}, "input")
-        # Sleep to make it exceed threshold
-        import time
-        time.sleep(0.002)  # 2ms
         handler.on_tool_end("output")
         
         assert len(handler.alerts) >= 1
@@ -238,13 +244,31 @@ class TestMonitoringDashboard:
         assert "=" in report  # Header separator
 
 
+@pytest.fixture(scope="session")
+def _session_alert_manager():
+    """Single AlertManager reused across tests; it is cheap to clear."""
+    return AlertManager()
+
+
+@pytest.fixture
+def manager(_session_alert_manager):
+    """Provide the shared AlertManager with no alerts or handlers."""
+    _session_alert_manager.alerts.clear()
+    _session_alert_manager.handlers.clear()
+    return _session_alert_manager
+
+
+def _seed_alerts(manager, specs):
+    """Trigger one alert per (type, severity, message) spec."""
+    for alert_type, severity, message in specs:
+        manager.trigger_alert(alert_type, severity, message)
+
+
 class TestAlertManager:
     """Tests for alert manager."""
 
-    def test_alert_creation(self):
+    def test_alert_creation(self, manager):
         """Test creating alerts."""
-        manager = AlertManager()
-        
         alert = manager.trigger_alert(
             AlertType.ERROR,
             AlertSeverity.HIGH,
@@ -261,10 +285,8 @@ class TestAlertManager:
         assert alert.session_id == "session-123"
         assert not alert.resolved
 
-    def test_alert_resolution(self):
+    def test_alert_resolution(self, manager):
         """Test resolving alerts."""
-        manager = AlertManager()
-        
         alert = manager.trigger_alert(
             AlertType.ERROR,
             AlertSeverity.HIGH,
@@ -276,14 +298,14 @@ class TestAlertManager:
         assert alert.resolved
         assert alert.resolved_at is not None
 
-    def test_alert_filtering(self):
+    def test_alert_filtering(self, manager):
         """Test filtering alerts by type and severity."""
-        manager = AlertManager()
-        
         # Create different types of alerts
-        manager.trigger_alert(AlertType.ERROR, AlertSeverity.HIGH, "High error")
-        manager.trigger_alert(AlertType.PERFORMANCE, AlertSeverity.MEDIUM, "Medium perf")
-        manager.trigger_alert(AlertType.ERROR, AlertSeverity.LOW, "Low error")
+        _seed_alerts(manager, [
+            (AlertType.ERROR, AlertSeverity.HIGH, "High error"),
+            (AlertType.PERFORMANCE, AlertSeverity.MEDIUM, "Medium perf"),
+            (AlertType.ERROR, AlertSeverity.LOW, "Low error"),
+        ])
         
         # Test filtering by severity
         high_severity = manager.get_alerts_by_severity(AlertSeverity.HIGH)
@@ -296,13 +318,13 @@ class TestAlertManager:
         for alert in error_alerts:
             assert alert.alert_type == AlertType.ERROR
 
-    def test_alert_summary(self):
+    def test_alert_summary(self, manager):
         """Test alert summary generation."""
-        manager = AlertManager()
-        
         # Create some alerts
-        manager.trigger_alert(AlertType.ERROR, AlertSeverity.HIGH, "High error")
-        manager.trigger_alert(AlertType.PERFORMANCE, AlertSeverity.MEDIUM, "Medium perf")
+        _seed_alerts(manager, [
+            (AlertType.ERROR, AlertSeverity.HIGH, "High error"),
+            (AlertType.PERFORMANCE, AlertSeverity.MEDIUM, "Medium perf"),
+        ])
         
         summary = manager.get_alert_summary()
         
@@ -0,0 +1,48 @@
+"""Shared fixtures for agent node unit tests."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+_DEVICES = frozenset({"R1", "R2", "Switch1"})
+
+
+class _StubInventory:
+    """Read-only DeviceInventory stand-in with a fixed device list."""
+
+    def get_device_info(self):
+        return "R1 (cisco_ios)\nR2 (cisco_ios)\nSwitch1 (cisco_nxos)"
+
+    def get_all_device_names(self):
+        return sorted(_DEVICES)
+
+    def device_exists(self, device_name):
+        return device_name in _DEVICES
+
+    def validate_devices(self, device_names):
+        names = set(device_names)
+        return names & _DEVICES, names - _DEVICES
+
+
+@pytest.fixture(scope="session")
+def mock_llm_provider():
+    return Mock(_config=SimpleNamespace(max_history_tokens=1500))
+
+
+@pytest.fixture(scope="session")
+def mock_device_inventory():
+    return _StubInventory()
+
+
+@pytest.fixture(autouse=True)
+def _reset(mock_llm_provider):
+    yield
+    mock_llm_provider.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def human_status_msg():
+    """User turn asking for router status; read-only, so built once."""
+    return HumanMessage(content="Show me the status of router1")
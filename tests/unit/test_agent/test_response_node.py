@@ -0,0 +1,96 @@
+"""Unit tests for response_node function."""
+
+import json
+from unittest.mock import Mock
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from agent.constants import RAW_OUTPUT_PASSTHROUGH_CHARS
+from agent.nodes import response_node as response_func
+
+
+# Messages are never mutated by response_node, so they are built once
+_QUERY = HumanMessage(content="show version on R1")
+_PLAN = AIMessage(content="", tool_calls=[])
+
+
+def _state_with_tool_output(content: str) -> dict:
+    return {
+        "messages": [
+            _QUERY,
+            _PLAN,
+            ToolMessage(content=content, tool_call_id="call_1", name="show_command"),
+        ]
+    }
+
+
+def test_response_node_small_output_skips_llm(mock_llm_provider):
+    """Small single tool outputs are rendered per device without an LLM call."""
+    output = "Cisco IOS XE Software, Version 17.3\nROM: IOS-XE ROMMON\n"
+    state = _state_with_tool_output(json.dumps({
+        "devices": {"R1": {"success": True, "output": output, "error": None}},
+        "command": "show version",
+    }))
+
+    result = response_func(state=state, llm_provider=mock_llm_provider)
+
+    mock_llm_provider.get_llm.assert_not_called()
+    assert result["messages"][0].content == (
+        "### R1\n```\nCisco IOS XE Software, Version 17.3\nROM: IOS-XE ROMMON\n```"
+    )
+
+
+def test_response_node_small_batched_output_lists_commands(mock_llm_provider):
+    """Batched show output is rendered once per command under the device heading."""
+    batch = [{"command": "show clock", "output": "10:00"}, {"command": "show clock", "output": "10:01"}]
+    state = _state_with_tool_output(json.dumps({
+        "devices": {"R1": {"success": True, "output": batch, "error": None}},
+        "command": ["show clock", "show clock"],
+    }))
+
+    content = response_func(state=state, llm_provider=mock_llm_provider)["messages"][0].content
+
+    assert content.count("`show clock`") == 2
+    assert "```\n10:00\n```" in content and "```\n10:01\n```" in content
+
+
+def test_response_node_large_output_uses_llm(mock_llm_provider):
+    """Large tool outputs are still summarized by the LLM."""
+    state = _state_with_tool_output("x" * RAW_OUTPUT_PASSTHROUGH_CHARS)
+
+    mock_structured_llm = Mock()
+    mock_structured_llm.invoke.return_value = Mock(spec=[])
+    mock_llm = mock_llm_provider.get_llm.return_value
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+
+    response_func(state=state, llm_provider=mock_llm_provider)
+
+    mock_structured_llm.invoke.assert_called_once()
+
+
+def test_response_node_no_tool_calls_skips_llm(mock_llm_provider):
+    """A plain AI answer with no tool calls is not re-summarized."""
+    state = {
+        "messages": [
+            HumanMessage(content="hello"),
+            AIMessage(content="Hi! How can I help with your network?"),
+        ]
+    }
+
+    result = response_func(state=state, llm_provider=mock_llm_provider)
+
+    mock_llm_provider.get_llm.assert_not_called()
+    assert result == {"messages": []}
+
+
+def test_response_node_uniform_failure_skips_llm(mock_llm_provider):
+    """When every device fails with the same error it is reported without an LLM call."""
+    failure = {"success": False, "output": None, "error": "Authentication failed."}
+    state = _state_with_tool_output(
+        json.dumps({"devices": {"R1": failure, "R2": failure}, "command": "show version"})
+    )
+
+    result = response_func(state=state, llm_provider=mock_llm_provider)
+
+    mock_llm_provider.get_llm.assert_not_called()
+    assert "Authentication failed." in result["messages"][0].content
@@ -0,0 +1,64 @@
+"""Shared fixtures for CLI unit tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def _cli_doubles():
+    """Patch cli.application collaborators once per module."""
+    doubles = {
+        "config": MagicMock(),
+        "bootstrapper": MagicMock(),
+        "orchestrator": MagicMock(),
+    }
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("cli.application.NetworkAgentConfig", lambda *a, **k: doubles["config"])
+        mp.setattr("cli.application.AppBootstrapper", lambda *a, **k: doubles["bootstrapper"])
+        mp.setattr(
+            "cli.application.WorkflowOrchestrator", lambda *a, **k: doubles["orchestrator"]
+        )
+        yield doubles
+
+
+@pytest.fixture
+def mock_app(_cli_doubles):
+    """Mock NetworkAgentCLI with all dependencies."""
+    for double in _cli_doubles.values():
+        double.reset_mock(return_value=True, side_effect=True)
+
+    # Setup bootstrapper mock; tests mutate the components dict, so build it fresh
+    _cli_doubles["bootstrapper"].build_app.return_value = {
+        "nornir": MagicMock(),
+        "inventory": MagicMock(),
+        "executor": MagicMock(),
+        "llm": MagicMock(),
+        "tools": MagicMock(),
+        "workflow": MagicMock(),
+        "ui": MagicMock(),
+    }
+
+    # Setup orchestrator mock
+    mock_orchestrator = _cli_doubles["orchestrator"]
+    mock_orchestrator.execute_command.return_value = {"messages": []}
+    # The compiled graph exposes no session stats
+    mock_orchestrator.workflow.get_session_stats.return_value = None
+
+    return _cli_doubles
+
+
+@pytest.fixture(scope="module")
+def _shared_cli(_cli_doubles):
+    """Construct NetworkAgentCLI once per module against the patched collaborators."""
+    from cli.application import NetworkAgentCLI
+
+    return NetworkAgentCLI(_cli_doubles["config"])
+
+
+@pytest.fixture
+def cli(_shared_cli, mock_app):
+    """Shared NetworkAgentCLI wired to this test's freshly reset components."""
+    _shared_cli.components = mock_app["bootstrapper"].build_app.return_value
+    return _shared_cli
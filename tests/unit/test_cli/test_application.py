@@ -2,58 +2,22 @@
 
 from unittest.mock import MagicMock, patch
 
-import pytest
-
-from cli.application import NetworkAgentCLI
-
-
-@pytest.fixture
-def mock_app():
-    """Mock NetworkAgentCLI with all dependencies."""
-    with (
-        patch("cli.application.NetworkAgentConfig") as mock_config_cls,
-        patch("cli.application.AppBootstrapper") as mock_bootstrapper_cls,
-        patch("cli.application.WorkflowOrchestrator") as mock_orchestrator_cls,
-    ):
-        # Setup minimum required mocks
-        mock_config = MagicMock()
-        mock_config_cls.return_value = mock_config
-
-        # Setup bootstrapper mock
-        mock_bootstrapper = mock_bootstrapper_cls.return_value
-        mock_bootstrapper.build_app.return_value = {
-            "nornir": MagicMock(),
-            "inventory": MagicMock(),
-            "executor": MagicMock(),
-            "llm": MagicMock(),
-            "tools": MagicMock(),
-            "workflow": MagicMock(),
-            "ui": MagicMock(),
-        }
-
-        # Setup orchestrator mock
-        mock_orchestrator = mock_orchestrator_cls.return_value
-        mock_orchestrator.execute_command.return_value = {"messages": []}
-
-        yield {
-            "config": mock_config,
-            "bootstrapper": mock_bootstrapper,
-            "orchestrator": mock_orchestrator,
-        }
+# cli.application pulls in LangGraph via the bootstrapper, so it is imported
+# inside tests and fixtures to keep collection of this module lightweight.
 
 
 def test_cli_initialization(mock_app):
     """Test CLI initialization."""
+    from cli.application import NetworkAgentCLI
+
     cli = NetworkAgentCLI(mock_app["config"])
     assert cli is not None
     mock_app["bootstrapper"].build_app.assert_called_once()
     mock_app["orchestrator"].execute_command  # Verify orchestrator was created
 
 
-def test_run_single_command(mock_app):
+def test_run_single_command(cli, mock_app):
     """Test running a single command."""
-    cli = NetworkAgentCLI(mock_app["config"])
-
     cli.run_single_command("show version", "R1")
 
     # Verify orchestrator was called with session_id
@@ -63,10 +27,8 @@ def test_run_single_command(mock_app):
     assert call_args[1]["session_id"] is not None
 
 
-def test_run_interactive_chat_exit(mock_app):
+def test_run_interactive_chat_exit(cli):
     """Test interactive chat loop exit."""
-    cli = NetworkAgentCLI(mock_app["config"])
-
     # Mock user input to exit immediately
     mock_ui = MagicMock()
     mock_ui.print_command_input_prompt.return_value = "exit"
@@ -88,10 +50,8 @@ def test_run_interactive_chat_exit(mock_app):
             assert call_args[1]["session_id"] is not None
 
 
-def test_cleanup(mock_app):
+def test_cleanup(cli):
     """Test resource cleanup."""
-    cli = NetworkAgentCLI(mock_app["config"])
-
     # Access mocked nornir manager to verify close is called
     mock_nornir = cli.components["nornir"]
     cli.cleanup()
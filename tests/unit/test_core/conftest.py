@@ -0,0 +1,39 @@
+"""Shared fixtures for core unit tests."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from core.config import NetworkAgentConfig
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Default configuration; the core classes under test only store it."""
+    return NetworkAgentConfig()
+
+
+@pytest.fixture(scope="session")
+def nornir_manager_proto():
+    """NornirManager mock, built once and reset by each module's fixture."""
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def _no_dotenv(monkeypatch):
+    """Keep a developer's .env file out of config loading."""
+    monkeypatch.setattr("core.config.load_dotenv", lambda *a, **k: None)
+
+
+@pytest.fixture
+def init_nornir(monkeypatch):
+    """Replace InitNornir so NornirManager never builds a real Nornir instance."""
+    mock_init = MagicMock()
+    monkeypatch.setattr("core.nornir_manager.InitNornir", mock_init)
+    return mock_init
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make TaskExecutor backoff and settle delays instantaneous."""
+    monkeypatch.setattr("core.task_executor.time.sleep", lambda _: None)
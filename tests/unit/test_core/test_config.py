@@ -1,66 +1,68 @@
 """Unit tests for NetworkAgentConfig."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
 from core.config import NetworkAgentConfig
 
 
-def test_config_load_defaults():
+@pytest.fixture
+def env(monkeypatch):
+    """Clear every config variable and return a setter for the test's overrides."""
+    for env_var in NetworkAgentConfig._ENV_MAPPING:
+        monkeypatch.delenv(env_var, raising=False)
+
+    def _set(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(name, value)
+
+    return _set
+
+
+def test_config_load_defaults(env):
     """Test loading configuration with defaults."""
-    # Mock environment variables to ensure clean state
-    with patch.dict(os.environ, {"GROQ_API_KEY": "test_key"}, clear=True):
-        # Mock load_dotenv to prevent reading actual .env file
-        with patch("core.config.load_dotenv"):
-            config = NetworkAgentConfig.from_env()
+    env(GROQ_API_KEY="test_key")
+    config = NetworkAgentConfig.from_env()
 
-            assert config.groq_api_key == "test_key"
-            assert config.llm_model_name == "openai/gpt-oss-120b"
-            assert config.llm_temperature == 0.0  # Default from config is now 0.0 for production
-            assert config.num_workers == 20
-            assert config.netmiko_timeout == 30
+    assert config.groq_api_key == "test_key"
+    assert config.llm_model_name == "openai/gpt-oss-120b"
+    assert config.llm_temperature == 0.0  # Default from config is now 0.0 for production
+    assert config.num_workers == 20
+    assert config.netmiko_timeout == 30
+    # Never above Netmiko's own send_command default of 10s
+    assert config.netmiko_read_timeout == 10
 
 
-def test_config_load_env_overrides():
+def test_config_load_env_overrides(env):
     """Test loading configuration with environment variable overrides."""
-    env_vars = {
-        "GROQ_API_KEY": "test_key",
-        "LLM_MODEL_NAME": "custom-model",
-        "LLM_TEMPERATURE": "0.5",
-        "NUM_WORKERS": "10",
-        "NETMIKO_TIMEOUT": "60",
-    }
-
-    with patch.dict(os.environ, env_vars, clear=True):
-        with patch("core.config.load_dotenv"):
-            config = NetworkAgentConfig.from_env()
+    env(
+        GROQ_API_KEY="test_key",
+        LLM_MODEL_NAME="custom-model",
+        LLM_TEMPERATURE="0.5",
+        NUM_WORKERS="10",
+        NETMIKO_TIMEOUT="60",
+    )
+    config = NetworkAgentConfig.from_env()
 
-            assert config.llm_model_name == "custom-model"
-            assert config.llm_temperature == 0.5
-            assert config.num_workers == 10
-            assert config.netmiko_timeout == 60
+    assert config.llm_model_name == "custom-model"
+    assert config.llm_temperature == 0.5
+    assert config.num_workers == 10
+    assert config.netmiko_timeout == 60
 
 
-def test_config_validation_missing_api_key():
+def test_config_validation_missing_api_key(env):
     """Test validation fails when API key is missing."""
-    with patch.dict(os.environ, {}, clear=True):
-        with patch("core.config.load_dotenv"):
-            # Should not raise on init
-            config = NetworkAgentConfig.from_env()
+    # Should not raise on init
+    config = NetworkAgentConfig.from_env()
 
-            # Should raise RuntimeError on validate()
-            with pytest.raises(
-                RuntimeError, match="GROQ_API_KEY environment variable is required"
-            ):
-                config.validate()
+    # Should raise RuntimeError on validate()
+    with pytest.raises(RuntimeError, match="GROQ_API_KEY environment variable is required"):
+        config.validate()
 
 
-def test_config_log_skip_modules():
+def test_config_log_skip_modules(env):
     """Test parsing of log skip modules."""
-    with patch.dict(os.environ, {"GROQ_API_KEY": "test_key"}, clear=True):
-        config = NetworkAgentConfig.from_env()
-        # Check default list
-        assert "httpcore" in config.log_skip_modules
-        assert "httpx" in config.log_skip_modules
+    env(GROQ_API_KEY="test_key")
+    config = NetworkAgentConfig.from_env()
+    # Check default list
+    assert "httpcore" in config.log_skip_modules
+    assert "httpx" in config.log_skip_modules
@@ -1,32 +1,33 @@
 """Unit tests for DeviceInventory."""
 
-from unittest.mock import MagicMock, Mock
+from types import SimpleNamespace
 
 import pytest
 
 from core.device_inventory import DeviceInventory
-from core.nornir_manager import NornirManager
 
 
 @pytest.fixture
-def mock_nornir_manager():
+def mock_nornir_manager(nornir_manager_proto):
     """Create a mock NornirManager."""
-    manager = MagicMock(spec=NornirManager)
+    manager = nornir_manager_proto
+    manager.reset_mock(return_value=True, side_effect=True)
 
     # Mock hosts
-    r1 = Mock()
-    r1.name = "R1"
-    r1.hostname = "192.168.1.1"
-    r1.platform = "cisco_ios"
-    r1.groups = ["routers"]
-    r1.data = {"site": "nyc"}
-
-    s1 = Mock()
-    s1.name = "S1"
-    s1.hostname = "192.168.1.2"
-    s1.platform = "cisco_nxos"
-    s1.groups = ["switches"]
-    s1.data = {}
+    r1 = SimpleNamespace(
+        name="R1",
+        hostname="192.168.1.1",
+        platform="cisco_ios",
+        groups=["routers"],
+        data={"site": "nyc"},
+    )
+    s1 = SimpleNamespace(
+        name="S1",
+        hostname="192.168.1.2",
+        platform="cisco_nxos",
+        groups=["switches"],
+        data={},
+    )
 
     manager.get_hosts.return_value = {"R1": r1, "S1": s1}
     return manager
@@ -45,26 +46,21 @@ def test_get_device_info(mock_nornir_manager):
     assert "cisco_nxos" in info
 
 
-def test_validate_devices_all_valid(mock_nornir_manager):
-    """Test validation when all devices exist."""
+@pytest.mark.parametrize(
+    "names,expected_valid,expected_invalid",
+    [
+        (["R1", "S1"], {"R1", "S1"}, set()),
+        (["R1", "INVALID_DEV"], {"R1"}, {"INVALID_DEV"}),
+    ],
+    ids=["all_valid", "mixed"],
+)
+def test_validate_devices(mock_nornir_manager, names, expected_valid, expected_invalid):
+    """Test validation splits requested devices into valid and invalid sets."""
     inventory = DeviceInventory(mock_nornir_manager)
-    valid, invalid = inventory.validate_devices(["R1", "S1"])
+    valid, invalid = inventory.validate_devices(names)
 
-    assert len(valid) == 2
-    assert "R1" in valid
-    assert "S1" in valid
-    assert len(invalid) == 0
-
-
-def test_validate_devices_mixed(mock_nornir_manager):
-    """Test validation with mixed valid and invalid devices."""
-    inventory = DeviceInventory(mock_nornir_manager)
-    valid, invalid = inventory.validate_devices(["R1", "INVALID_DEV"])
-
-    assert len(valid) == 1
-    assert "R1" in valid
-    assert len(invalid) == 1
-    assert "INVALID_DEV" in invalid
+    assert valid == expected_valid
+    assert invalid == expected_invalid
 
 
 def test_get_all_device_names(mock_nornir_manager):
@@ -1,150 +1,186 @@
 """Unit tests for NornirManager."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
-import pytest
-
-from core.config import NetworkAgentConfig
 from core.nornir_manager import NornirManager
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration."""
-    config = MagicMock(spec=NetworkAgentConfig)
-    config.nornir_config_file = "config.yaml"
-    return config
-
-
-def test_nornir_lazy_loading(mock_config):
+def test_nornir_lazy_loading(mock_config, init_nornir):
     """Test that Nornir is initialized only when accessed."""
-    with patch("core.nornir_manager.InitNornir") as mock_init:
-        manager = NornirManager(mock_config)
+    manager = NornirManager(mock_config)
 
-        # Should not be initialized yet
-        mock_init.assert_not_called()
+    # Should not be initialized yet
+    init_nornir.assert_not_called()
 
-        # Access property
-        _ = manager.nornir
+    # Access property
+    _ = manager.nornir
 
-        # Should be initialized now
-        mock_init.assert_called_once_with(config_file="config.yaml")
+    # Should be initialized now
+    init_nornir.assert_called_once_with(config_file="config.yaml")
 
-        # Access again
-        _ = manager.nornir
+    # Access again
+    _ = manager.nornir
 
-        # Should still be called only once
-        mock_init.assert_called_once()
+    # Should still be called only once
+    init_nornir.assert_called_once()
 
 
-def test_get_hosts(mock_config):
+def test_get_hosts(mock_config, init_nornir):
     """Test retrieving hosts from inventory."""
-    with patch("core.nornir_manager.InitNornir") as mock_init:
-        # Setup mock inventory
-        mock_nornir = MagicMock()
-        mock_nornir.inventory.hosts.items.return_value = [
-            ("R1", "host_obj_1"),
-            ("R2", "host_obj_2"),
-        ]
-        mock_init.return_value = mock_nornir
+    # Setup mock inventory
+    mock_nornir = MagicMock()
+    mock_nornir.inventory.hosts.items.return_value = [
+        ("R1", "host_obj_1"),
+        ("R2", "host_obj_2"),
+    ]
+    init_nornir.return_value = mock_nornir
 
-        manager = NornirManager(mock_config)
-        hosts = manager.get_hosts()
+    manager = NornirManager(mock_config)
+    hosts = manager.get_hosts()
 
-        assert len(hosts) == 2
-        assert hosts["R1"] == "host_obj_1"
-        assert hosts["R2"] == "host_obj_2"
+    assert len(hosts) == 2
+    assert hosts["R1"] == "host_obj_1"
+    assert hosts["R2"] == "host_obj_2"
 
 
-def test_filter_hosts(mock_config):
+def test_filter_hosts(mock_config, init_nornir):
     """Test filtering hosts."""
-    with patch("core.nornir_manager.InitNornir") as mock_init:
-        mock_nornir = MagicMock()
-        mock_init.return_value = mock_nornir
+    mock_nornir = MagicMock()
+    init_nornir.return_value = mock_nornir
 
-        manager = NornirManager(mock_config)
+    manager = NornirManager(mock_config)
 
-        # Mock the filter method
-        manager.filter_hosts(["R1", "R2"])
+    # Mock the filter method
+    manager.filter_hosts(["R1", "R2"])
 
-        # Verify filter was called correctly
-        # Note: We can't easily check the F object equality, but we can check the call happened
-        mock_nornir.filter.assert_called_once()
+    # Verify filter was called correctly
+    # Note: We can't easily check the F object equality, but we can check the call happened
+    mock_nornir.filter.assert_called_once()
 
 
-def test_filter_hosts_with_workers(mock_config):
+def test_filter_hosts_with_workers(mock_config, init_nornir):
     """Test filtering hosts with custom worker count."""
-    with patch("core.nornir_manager.InitNornir") as mock_init:
-        mock_nornir = MagicMock()
-        # Set up the config structure to match actual implementation
-        mock_nornir.config.runner.options = {"num_workers": 20}  # Default
+    mock_nornir = MagicMock()
+    # Set up the config structure to match actual implementation
+    mock_nornir.config.runner.options = {"num_workers": 20}  # Default
 
-        # Mock the filter method to return a filtered instance with proper config structure
-        filtered_instance = MagicMock()
-        filtered_instance.config.runner.options = {"num_workers": 20}  # Default for filtered instance
-        mock_nornir.filter.return_value = filtered_instance
+    # Mock the filter method to return a filtered instance with proper config structure
+    filtered_instance = MagicMock()
+    filtered_instance.config.runner.options = {"num_workers": 20}  # Default for filtered instance
+    mock_nornir.filter.return_value = filtered_instance
 
-        mock_init.return_value = mock_nornir
+    init_nornir.return_value = mock_nornir
 
-        manager = NornirManager(mock_config)
+    manager = NornirManager(mock_config)
 
-        # Test filtering with custom worker count
-        result = manager.filter_hosts(["R1", "R2"], num_workers=10)
+    # Test filtering with custom worker count
+    result = manager.filter_hosts(["R1", "R2"], num_workers=10)
 
-        # Verify filter was called and worker count was set in runner options
-        mock_nornir.filter.assert_called_once()
-        assert result.config.runner.options["num_workers"] == 10
+    # Verify filter was called and worker count was set in runner options
+    mock_nornir.filter.assert_called_once()
+    assert result.config.runner.options["num_workers"] == 10
 
 
-def test_test_connectivity_method(mock_config):
-    """Test the connectivity testing method."""
-    with patch("core.nornir_manager.InitNornir") as mock_init:
-        mock_nornir = MagicMock()
-        mock_init.return_value = mock_nornir
+def test_close(mock_config, init_nornir):
+    """Test closing connections."""
+    mock_nornir = MagicMock()
+    init_nornir.return_value = mock_nornir
 
-        # Setup mock inventory hosts
-        mock_hosts = {
-            "R1": MagicMock(),
-            "R2": MagicMock()
-        }
-        mock_nornir.inventory.hosts.items.return_value = mock_hosts.items()
+    manager = NornirManager(mock_config)
 
-        # Setup mock results for connectivity test
-        mock_results = MagicMock()
-        mock_results.items.return_value = [
-            ("R1", MagicMock(failed=False)),  # R1 is reachable
-            ("R2", MagicMock(failed=True))   # R2 is not reachable
-        ]
-        mock_nornir.filter.return_value.run.return_value = mock_results
+    # Initialize
+    _ = manager.nornir
 
-        manager = NornirManager(mock_config)
+    # Close
+    manager.close()
 
-        # Test connectivity for all hosts
-        results = manager.test_connectivity()
+    mock_nornir.close_connections.assert_called_once()
 
-        # Verify results
-        assert results["R1"] is True  # R1 should be reachable
-        assert results["R2"] is False  # R2 should not be reachable
+    # Verify internal reference is cleared (though implementation detail)
+    # We can verify by checking if accessing nornir triggers init again
+    init_nornir.reset_mock()
+    _ = manager.nornir
+    init_nornir.assert_called_once()
 
 
-def test_close(mock_config):
-    """Test closing connections."""
-    with patch("core.nornir_manager.InitNornir") as mock_init:
-        mock_nornir = MagicMock()
-        mock_init.return_value = mock_nornir
+def _host_with_session(alive=True):
+    """Inventory host double holding a cached Netmiko connection."""
+    connection = SimpleNamespace(connection=Mock(**{"is_alive.return_value": alive}))
+    return SimpleNamespace(connections={"netmiko": connection}, close_connection=Mock())
+
+
+def _reserve(manager, hostnames):
+    """Run an empty task against the hosts."""
+    with manager.reserve_connections(hostnames):
+        pass
+
+
+def test_reserve_connections_closes_dead_sessions(mock_config, init_nornir):
+    """Test that only dead cached sessions are closed."""
+    dead, alive = _host_with_session(alive=False), _host_with_session()
+    init_nornir.return_value.inventory.hosts.items.return_value = [("R1", dead), ("R2", alive)]
+
+    _reserve(NornirManager(mock_config), ["R1", "R2"])
+
+    dead.close_connection.assert_called_once_with("netmiko")
+    alive.close_connection.assert_not_called()
+
+
+def test_reserve_connections_closes_idle_sessions(mock_config, init_nornir, monkeypatch):
+    """Test that live sessions idle past the timeout since their last task are closed."""
+    host = _host_with_session()
+    init_nornir.return_value.inventory.hosts.items.return_value = [("R1", host)]
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr("core.nornir_manager.time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    manager = NornirManager(mock_config)
+    _reserve(manager, ["R1"])
+    host.close_connection.assert_not_called()
+
+    clock.now = mock_config.conn_pool_idle_timeout + 1.0
+    _reserve(manager, ["R1"])
+    host.close_connection.assert_called_once_with("netmiko")
+
+
+def test_reserve_connections_skips_hosts_in_use(mock_config, init_nornir):
+    """A session another task is using is never probed."""
+    host = _host_with_session()
+    init_nornir.return_value.inventory.hosts.items.return_value = [("R1", host)]
+    manager = NornirManager(mock_config)
+
+    with manager.reserve_connections(["R1"]):
+        host.connections["netmiko"].connection.is_alive.reset_mock()
+        _reserve(manager, ["R1"])
+        host.connections["netmiko"].connection.is_alive.assert_not_called()
+
+    host.connections["netmiko"].connection.is_alive.return_value = False
+    _reserve(manager, ["R1"])
+    host.close_connection.assert_called_once_with("netmiko")
+
+
+def test_reserve_connections_closes_broken_sessions(mock_config, init_nornir):
+    """A session whose liveness check raises is closed before it is dropped."""
+    host = _host_with_session()
+    host.connections["netmiko"].connection.is_alive.side_effect = OSError("socket closed")
+    init_nornir.return_value.inventory.hosts.items.return_value = [("R1", host)]
+
+    _reserve(NornirManager(mock_config), ["R1"])
 
-        manager = NornirManager(mock_config)
+    host.close_connection.assert_called_once_with("netmiko")
+    assert "netmiko" not in host.connections
 
-        # Initialize
-        _ = manager.nornir
 
-        # Close
-        manager.close()
+def test_reserve_connections_probes_outside_lock(mock_config, init_nornir):
+    """The liveness probe runs without the manager lock, so other hosts are not blocked."""
+    host = _host_with_session()
+    init_nornir.return_value.inventory.hosts.items.return_value = [("R1", host)]
+    manager = NornirManager(mock_config)
+    lock_held = []
+    host.connections["netmiko"].connection.is_alive.side_effect = (
+        lambda: lock_held.append(manager._conn_lock.locked()) or True
+    )
 
-        mock_nornir.close_connections.assert_called_once()
+    _reserve(manager, ["R1"])
 
-        # Verify internal reference is cleared (though implementation detail)
-        # We can verify by checking if accessing nornir triggers init again
-        mock_init.reset_mock()
-        _ = manager.nornir
-        mock_init.assert_called_once()
+    assert lock_held == [False]
@@ -1,29 +1,35 @@
 """Unit tests for TaskExecutor retry functionality."""
 
-from unittest.mock import MagicMock, patch
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 import pytest
 
-from core.config import NetworkAgentConfig
-from core.nornir_manager import NornirManager
 from core.task_executor import TaskExecutor
-from netmiko.exceptions import NetmikoTimeoutException
+from netmiko.exceptions import NetmikoTimeoutException, ReadTimeout
 
+pytestmark = pytest.mark.usefixtures("no_sleep")
+
+# Shared by every simulated transient failure; results only carry a reference
+_TIMEOUT_EXC = NetmikoTimeoutException("Connection timeout")
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration."""
-    config = MagicMock(spec=NetworkAgentConfig)
-    config.nornir_config_file = "config.yaml"
-    return config
+
+def _aggregated(result):
+    """Build an AggregatedResult stand-in holding a single R1 result."""
+    aggregated = Mock()
+    aggregated.items.return_value = [("R1", result)]
+    return aggregated
 
 
 @pytest.fixture
-def mock_nornir_manager():
+def mock_nornir_manager(nornir_manager_proto):
     """Create a mock NornirManager."""
-    manager = MagicMock(spec=NornirManager)
-    manager.get_hosts.return_value = {"R1": MagicMock(), "R2": MagicMock()}
-    manager.filter_hosts.return_value = MagicMock()
+    manager = nornir_manager_proto
+    manager.reset_mock(return_value=True, side_effect=True)
+    manager.get_hosts.return_value = {"R1": Mock(), "R2": Mock()}
+    manager.filter_hosts.return_value = Mock(inventory=SimpleNamespace(hosts=manager.get_hosts.return_value))
     manager.test_connectivity.return_value = {"R1": True, "R2": True}
+    manager.reserve_connections.return_value = nullcontext()
     return manager
 
 
@@ -32,22 +38,38 @@ def test_execute_task_with_retries_success(mock_config, mock_nornir_manager):
     executor = TaskExecutor(mock_nornir_manager)
 
     # Mock the _execute_with_retry method to return successful results
-    with patch.object(executor, '_execute_with_retry') as mock_retry:
-        mock_results = MagicMock()
-        mock_results.items.return_value = [
-            ("R1", MagicMock(failed=False, result="success"))
-        ]
-        mock_retry.return_value = mock_results
+    mock_results = Mock()
+    mock_results.items.return_value = [
+        # MultiResult is indexed by _process_results, so it needs magic methods
+        ("R1", MagicMock(failed=False, result="success"))
+    ]
+    # The executor is local to this test, so plain assignment needs no cleanup
+    mock_retry = Mock(return_value=mock_results)
+    executor._execute_with_retry = mock_retry
+
+    results = executor.execute_task(
+        target_devices=["R1"],
+        task_function=Mock(),
+        max_retries=2
+    )
+
+    # Verify the retry method was called with the correct parameters
+    mock_retry.assert_called_once()
+    assert results["R1"]["success"] is True
 
-        results = executor.execute_task(
-            target_devices=["R1"],
-            task_function=MagicMock(),
-            max_retries=2
-        )
 
-        # Verify the retry method was called with the correct parameters
-        mock_retry.assert_called_once()
-        assert results["R1"]["success"] is True
+@pytest.mark.parametrize(
+    ("targets", "unknown"),
+    [(["R1", "R9"], ["R9"]), (["R8", "R9"], ["R8", "R9"])],
+)
+def test_execute_task_reports_unknown_devices(mock_config, mock_nornir_manager, targets, unknown):
+    """Devices missing from the filtered inventory are rejected before any connection."""
+    executor = TaskExecutor(mock_nornir_manager)
+
+    results = executor.execute_task(target_devices=targets, task_function=Mock())
+
+    assert results == {"error": f"Devices not found: {unknown}"}
+    mock_nornir_manager.test_connectivity.assert_not_called()
 
 
 def test_execute_with_retry_logic(mock_config, mock_nornir_manager):
@@ -55,35 +77,17 @@ def test_execute_with_retry_logic(mock_config, mock_nornir_manager):
     executor = TaskExecutor(mock_nornir_manager)
 
     # Create a mock nornir instance
-    mock_nornir_instance = MagicMock()
-
-    # Mock the run method to simulate transient failures that eventually succeed
-    call_count = 0
-    def mock_run_side_effect(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-
-        if call_count == 1:  # First call fails with timeout
-            mock_result = MagicMock()
-            mock_result.failed = True
-            mock_result.exception = NetmikoTimeoutException("Connection timeout")
-            mock_aggregated_result = MagicMock()
-            mock_aggregated_result.items.return_value = [("R1", mock_result)]
-            return mock_aggregated_result
-        else:  # Subsequent call succeeds
-            mock_result = MagicMock()
-            mock_result.failed = False
-            mock_result.result = "Success after retry"
-            mock_aggregated_result = MagicMock()
-            mock_aggregated_result.items.return_value = [("R1", mock_result)]
-            return mock_aggregated_result
-
-    mock_nornir_instance.run.side_effect = mock_run_side_effect
+    mock_nornir_instance = Mock()
+
+    # First attempt fails with a timeout, the retry succeeds
+    fail_result = SimpleNamespace(failed=True, exception=_TIMEOUT_EXC)
+    ok_result = SimpleNamespace(failed=False, exception=None, result="Success after retry")
+    mock_nornir_instance.run.side_effect = [_aggregated(fail_result), _aggregated(ok_result)]
 
     # Test the retry functionality
     results = executor._execute_with_retry(
         nornir_instance=mock_nornir_instance,
-        task_function=MagicMock(),
+        task_function=Mock(),
         max_retries=2
     )
 
@@ -100,21 +104,14 @@ def test_execute_with_retry_exhausted(mock_config, mock_nornir_manager):
     executor = TaskExecutor(mock_nornir_manager)
 
     # Mock the run method to always fail
-    def mock_run_side_effect(*args, **kwargs):
-        mock_result = MagicMock()
-        mock_result.failed = True
-        mock_result.exception = NetmikoTimeoutException("Connection timeout")
-        mock_aggregated_result = MagicMock()
-        mock_aggregated_result.items.return_value = [("R1", mock_result)]
-        return mock_aggregated_result
-
-    mock_nornir_instance = MagicMock()
-    mock_nornir_instance.run.side_effect = mock_run_side_effect
+    fail_result = SimpleNamespace(failed=True, exception=_TIMEOUT_EXC)
+    mock_nornir_instance = Mock()
+    mock_nornir_instance.run.return_value = _aggregated(fail_result)
 
     # Test the retry functionality with max retries
     results = executor._execute_with_retry(
         nornir_instance=mock_nornir_instance,
-        task_function=MagicMock(),
+        task_function=Mock(),
         max_retries=2
     )
 
@@ -123,4 +120,33 @@ def test_execute_with_retry_exhausted(mock_config, mock_nornir_manager):
 
     # Check that the final result still shows failure
     for hostname, result in results.items():
-        assert result.failed
\ No newline at end of file
+        assert result.failed
+
+
+def test_execute_with_retry_skips_read_timeout(mock_config, mock_nornir_manager):
+    """Test that read timeouts are not retried."""
+    executor = TaskExecutor(mock_nornir_manager)
+
+    timeout_result = SimpleNamespace(failed=True, exception=ReadTimeout("Pattern not detected"))
+    mock_nornir_instance = Mock()
+    mock_nornir_instance.run.return_value = _aggregated(timeout_result)
+
+    executor._execute_with_retry(
+        nornir_instance=mock_nornir_instance,
+        task_function=Mock(),
+        max_retries=2
+    )
+
+    # Only the original attempt, no retries
+    assert mock_nornir_instance.run.call_count == 1
+
+
+def test_read_timeout_error_message(mock_config, mock_nornir_manager):
+    """A ReadTimeout is reported with the configured read timeout."""
+    executor = TaskExecutor(mock_nornir_manager, read_timeout=7)
+
+    message = executor._get_error_message(
+        SimpleNamespace(exception=ReadTimeout("Pattern not detected"))
+    )
+
+    assert message.startswith("Timed out after 7s waiting for command output.")
@@ -0,0 +1,25 @@
+"""Shared fixtures for tool unit tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def task_executor_proto():
+    """TaskExecutor mock, built once and reset for each test."""
+    return Mock(read_timeout=10)
+
+
+@pytest.fixture
+def mock_task_executor(task_executor_proto):
+    task_executor_proto.reset_mock(return_value=True, side_effect=True)
+    return task_executor_proto
+
+
+@pytest.fixture(scope="session")
+def created_tools(task_executor_proto):
+    """Tools from create_tools(), built once; tests only inspect their metadata."""
+    from tools import create_tools
+
+    return create_tools(task_executor_proto)
@@ -0,0 +1,76 @@
+"""Unit tests for config_command tool function."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+import yaml
+from netmiko.cisco import CiscoIosSSH
+
+from tools.config_tool import config_command
+
+_CONFIG_YAML = Path(__file__).resolve().parents[3] / "config.yaml"
+
+_PLAIN = ["interface Gi0/1", "description uplink", "no shutdown"]
+_PROMPTING = ["hostname R1", "crypto key generate rsa modulus 2048"]
+
+
+class _DirectExecutor:
+    """Runs the tool's Netmiko kwargs straight against one connection."""
+
+    read_timeout = 10
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def execute_task(self, target_devices, task_function, **kwargs):
+        return {
+            device: {"success": True, "output": self._connection.send_config_set(**kwargs)}
+            for device in target_devices
+        }
+
+
+def _offline_connection():
+    """Netmiko session built with the inventory's default extras and a fake channel."""
+    extras = yaml.safe_load(_CONFIG_YAML.read_text())["defaults"]["connection_options"]
+    connection = CiscoIosSSH(host="R1", **{**extras["netmiko"]["extras"], "auto_connect": False})
+    connection.base_prompt = "R1"
+    connection.config_mode = Mock(return_value="")
+    connection.exit_config_mode = Mock(return_value="")
+    connection.write_channel = Mock()
+    connection.read_channel_timing = Mock(return_value="")
+    connection.read_until_pattern = Mock(return_value="R1(config)#")
+    return connection
+
+
+@pytest.mark.parametrize(
+    ("configs", "cmd_verify"),
+    [
+        (_PLAIN, False),
+        (_PROMPTING, True),
+        (["no username admin"], True),
+    ],
+)
+def test_config_tool_verifies_only_interactive_sets(mock_task_executor, configs, cmd_verify):
+    """Echo verification is skipped unless a line may stop at a device prompt."""
+    mock_task_executor.execute_task.return_value = {"R1": "output"}
+
+    config_command(devices=["R1"], configs=configs, task_executor=mock_task_executor)
+
+    kwargs = mock_task_executor.execute_task.call_args.kwargs
+    assert kwargs["config_commands"] == configs
+    assert kwargs["cmd_verify"] is cmd_verify
+    # Config pushes keep Netmiko's own timeout, not the show-command one
+    assert "read_timeout" not in kwargs
+
+
+@pytest.mark.parametrize(("configs", "verified"), [(_PLAIN, False), (_PROMPTING, True)])
+def test_config_tool_verification_reaches_netmiko(configs, verified):
+    """Netmiko's send_config_set waits for each echo only for prompting config sets."""
+    connection = _offline_connection()
+
+    config_command(devices=["R1"], configs=configs, task_executor=_DirectExecutor(connection))
+
+    assert connection.write_channel.call_count == len(configs)
+    # Verified mode reads the echo and the prompt after every line
+    assert connection.read_until_pattern.call_count == (2 * len(configs) if verified else 0)
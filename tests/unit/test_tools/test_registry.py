@@ -1,70 +1,80 @@
 """Unit tests for tool registry and decorator."""
 
-from unittest.mock import MagicMock
-
 import pytest
 from pydantic import BaseModel, Field
 
 from core.task_executor import TaskExecutor
-from tools.registry import get_all_tools, get_tool, network_tool, reset_registry
+from tools.registry import ToolRegistry, get_all_tools, get_tool, network_tool
 
 
-def test_network_tool_decorator():
-    """Test the network_tool decorator functionality."""
+class ToolArgs(BaseModel):
+    arg1: str = Field(description="Argument 1")
+    arg2: int = Field(description="Argument 2", default=0)
 
-    class TestSchema(BaseModel):
-        arg1: str = Field(description="Argument 1")
-        arg2: int = Field(description="Argument 2", default=0)
 
-    # Reset registry to start fresh
-    reset_registry()
+@pytest.fixture(scope="module")
+def registry():
+    """Private registry with this module's tools; the global one is left untouched."""
+    registry = ToolRegistry()
 
-    @network_tool(name="test_tool", description="A test tool", schema=TestSchema)
+    @network_tool(name="test_tool", description="A test tool", schema=ToolArgs, registry=registry)
     def test_tool_function(arg1: str, arg2: int = 0, task_executor: TaskExecutor = None):
         return f"Executed with {arg1} and {arg2}"
 
-    # Verify the tool was registered
-    tools = get_all_tools()
-    assert len(tools) == 1
-
-    tool = tools[0]
-    assert tool.name == "test_tool"
-    assert "A test tool" in tool.description
-
-
-def test_get_specific_tool():
-    """Test getting a specific tool by name."""
-    # Reset registry to start fresh
-    reset_registry()
-
     @network_tool(
         name="specific_tool",
         description="A specific tool",
+        registry=registry,
     )
     def specific_tool_function(task_executor: TaskExecutor = None):
         return "Specific tool executed"
 
+    return registry
+
+
+def test_network_tool_decorator(registry):
+    """Test the network_tool decorator functionality."""
+    # Verify the tools were registered
+    tools = {tool.name: tool for tool in get_all_tools(registry)}
+    assert set(tools) == {"test_tool", "specific_tool"}
+
+    tool = tools["test_tool"]
+    assert "A test tool" in tool.description
+    assert tool.args_schema is ToolArgs
+
+
+def test_get_specific_tool(registry):
+    """Test getting a specific tool by name."""
     # Get the specific tool
-    tool = get_tool("specific_tool")
+    tool = get_tool("specific_tool", registry)
     assert tool.name == "specific_tool"
     assert "A specific tool" in tool.description
 
     # Test that getting a non-existent tool raises an error
     with pytest.raises(KeyError):
-        get_tool("non_existent_tool")
+        get_tool("non_existent_tool", registry)
 
 
-def test_create_tools_integration():
-    """Test that the tools are properly created via create_tools function."""
-    from tools import create_tools
+def test_get_tool_reuses_built_tool(registry):
+    """Test that repeated lookups return the cached StructuredTool."""
+    tool = get_tool("test_tool", registry)
+    assert get_tool("test_tool", registry) is tool
+    assert tool in get_all_tools(registry)
+
 
-    mock_task_executor = MagicMock(spec=TaskExecutor)
+def test_default_registry_holds_network_tools():
+    """Test that the built-in tools register on the global registry."""
+    import tools.config_tool  # noqa: F401
+    import tools.show_tool  # noqa: F401
 
-    # Create the tools
-    tools = create_tools(mock_task_executor)
+    names = {tool.name for tool in get_all_tools()}
+    assert {"show_command", "config_command"} <= names
 
+
+def test_create_tools_integration(created_tools):
+    """Test that the tools are properly created via create_tools function."""
     # Should have both show_command and config_command tools
-    tool_names = [tool.name for tool in tools]
+    tool_names = [tool.name for tool in created_tools]
     assert "show_command" in tool_names
     assert "config_command" in tool_names
     assert len(tool_names) == 2
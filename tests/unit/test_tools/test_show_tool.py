@@ -1,16 +1,28 @@
 """Unit tests for show_command tool function."""
 
-from unittest.mock import MagicMock
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from netmiko.exceptions import ReadTimeout
+from nornir.core import Nornir
+from nornir.core.configuration import Config
+from nornir.core.inventory import Defaults, Groups, Host, Hosts, Inventory
+from nornir.plugins.runners import SerialRunner
 
 from core.task_executor import TaskExecutor
-from tools.show_tool import show_command
+from tools.show_tool import send_commands, show_command
 
+EXPECTED_SHOW_VERSION = {"devices": {"R1": "output"}, "command": "show version"}
 
-@pytest.fixture
-def mock_task_executor():
-    return MagicMock(spec=TaskExecutor)
+
+def _nornir_with_session(send_command):
+    """Real Nornir over one host whose cached Netmiko session is a stub."""
+    host = Host("R1")
+    host.connections["netmiko"] = SimpleNamespace(connection=Mock(send_command=send_command))
+    inventory = Inventory(hosts=Hosts(R1=host), groups=Groups(), defaults=Defaults())
+    return Nornir(inventory=inventory, runner=SerialRunner(), config=Config())
 
 
 def test_show_tool_execution(mock_task_executor):
@@ -25,10 +37,49 @@ def test_show_tool_execution(mock_task_executor):
     call_args = mock_task_executor.execute_task.call_args
     assert call_args.kwargs["target_devices"] == ["R1"]
     assert call_args.kwargs["command_string"] == "show version"
+    assert call_args.kwargs["read_timeout"] == mock_task_executor.read_timeout
 
     # Verify result format (JSON string)
-    assert "R1" in result
-    assert "output" in result
+    assert json.loads(result) == EXPECTED_SHOW_VERSION
+
+
+def test_show_tool_batches_commands_in_one_task(mock_task_executor):
+    """A list of commands runs as a single task per device."""
+    commands = ["show version", "show ip int brief"]
+    mock_task_executor.execute_task.return_value = {"R1": "output"}
+
+    result = show_command(devices=["R1"], command=commands, task_executor=mock_task_executor)
+
+    mock_task_executor.execute_task.assert_called_once()
+    call_args = mock_task_executor.execute_task.call_args
+    assert call_args.kwargs["task_function"] is send_commands
+    assert call_args.kwargs["commands"] == commands
+    assert json.loads(result)["command"] == commands
+
+
+def test_send_commands_keeps_repeated_commands():
+    """Batch output is ordered per command, so a repeated command keeps both outputs."""
+    nornir = _nornir_with_session(Mock(side_effect=["before", "after"]))
+
+    result = nornir.run(task=send_commands, commands=["show clock", "show clock"])
+
+    assert result["R1"].result == [
+        {"command": "show clock", "output": "before"},
+        {"command": "show clock", "output": "after"},
+    ]
+
+
+def test_send_commands_failure_keeps_netmiko_exception():
+    """A failing command reaches the executor's error mapping as the Netmiko exception."""
+    nornir = _nornir_with_session(Mock(side_effect=["ok", ReadTimeout("no prompt")]))
+    executor = TaskExecutor(Mock(), read_timeout=5)
+
+    results = executor._execute_with_retry(
+        nornir_instance=nornir, task_function=send_commands, commands=["show a", "show b"]
+    )
+
+    assert isinstance(results["R1"].exception, ReadTimeout)
+    assert executor._process_results(results)["R1"]["error"].startswith("Timed out after 5s")
 
 
 def test_show_tool_execution_no_devices(mock_task_executor):
@@ -34,6 +34,7 @@ def create_tools(task_executor: TaskExecutor | None = None) -> list:
             "Run 'show' commands on network devices. "
             "Use for: viewing config, status, routing, ARP/MAC. "
             "REQUIREMENT: Use valid device names from inventory. "
+            "Pass a list of commands to run several shows on the same devices in one call. "
             "read-only operation. "
         ),
         args_schema=ShowCommandInput,
@@ -70,11 +70,17 @@ def config_command(
     clean_configs = ToolValidator.validate_configs(configs)
     ToolValidator.validate_config_command_semantics(clean_configs)
 
-    # Execute via task executor
+    # Execute via task executor. read_timeout is left at Netmiko's config default:
+    # the executor's value is sized for show output, and a push that times out may
+    # already be partly applied.
     results = task_executor.execute_task(
         target_devices=devices,
         task_function=netmiko_send_config,
         config_commands=clean_configs,
+        # Without echo verification every line is written and the output read once.
+        # A line that opens a device prompt would get the next lines as its answers,
+        # so such sets keep Netmiko's line-by-line verified mode.
+        cmd_verify=ToolValidator.requires_interactive_prompt(clean_configs),
     )
 
     # Process and return results
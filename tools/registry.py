@@ -5,55 +5,78 @@ from typing import Any, Callable, Dict, List
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel
 
-# Global registry for tools
-_tools_registry: Dict[str, Dict[str, Any]] = {}
 
+class ToolRegistry:
+    """Holds registered tool specs and the StructuredTools built from them."""
 
-def network_tool(name: str, description: str, schema: BaseModel = None):
-    """Decorator to register network tools."""
+    def __init__(self):
+        self._tools: Dict[str, Dict[str, Any]] = {}
+        # StructuredTool instances built from the registry, keyed by tool name
+        self._cache: Dict[str, StructuredTool] = {}
 
-    def decorator(func: Callable) -> Callable:
-        _tools_registry[name] = {
+    def register(self, name: str, func: Callable, description: str, schema: BaseModel = None):
+        """Register a tool function under the given name."""
+        self._tools[name] = {
             "func": func,
             "description": description,
             "schema": schema,
         }
+        self._cache.pop(name, None)
+
+    def get_tool(self, name: str) -> StructuredTool:
+        """Return the StructuredTool for a registered name, building it on first use."""
+        if name not in self._tools:
+            raise KeyError(f"Tool '{name}' not found in registry")
+
+        tool = self._cache.get(name)
+        if tool is None:
+            spec = self._tools[name]
+            tool = StructuredTool.from_function(
+                func=spec["func"],
+                name=name,
+                description=spec["description"],
+                args_schema=spec.get("schema", None),
+                handle_tool_errors=True,
+            )
+            self._cache[name] = tool
+        return tool
+
+    def get_all_tools(self) -> List[StructuredTool]:
+        """Return all registered tools."""
+        return [self.get_tool(name) for name in self._tools]
+
+    def reset(self):
+        """Remove all registered tools."""
+        self._tools.clear()
+        self._cache.clear()
+
+
+# Global registry for tools
+_default_registry = ToolRegistry()
+
+
+def network_tool(
+    name: str, description: str, schema: BaseModel = None, registry: ToolRegistry = None
+):
+    """Decorator to register network tools."""
+
+    def decorator(func: Callable) -> Callable:
+        (registry or _default_registry).register(name, func, description, schema)
         return func
 
     return decorator
 
 
-def get_all_tools() -> List[StructuredTool]:
+def get_all_tools(registry: ToolRegistry = None) -> List[StructuredTool]:
     """Return all registered tools."""
-    tools = []
-    for name, spec in _tools_registry.items():
-        tool = StructuredTool.from_function(
-            func=spec["func"],
-            name=name,
-            description=spec["description"],
-            args_schema=spec.get("schema", None),
-            handle_tool_errors=True,
-        )
-        tools.append(tool)
-    return tools
-
-
-def get_tool(name: str) -> StructuredTool:
-    """Get a specific tool by name."""
-    if name not in _tools_registry:
-        raise KeyError(f"Tool '{name}' not found in registry")
+    return (registry or _default_registry).get_all_tools()
 
-    spec = _tools_registry[name]
-    return StructuredTool.from_function(
-        func=spec["func"],
-        name=name,
-        description=spec["description"],
-        args_schema=spec.get("schema", None),
-        handle_tool_errors=True,
-    )
+
+def get_tool(name: str, registry: ToolRegistry = None) -> StructuredTool:
+    """Get a specific tool by name."""
+    return (registry or _default_registry).get_tool(name)
 
 
-def reset_registry():
+def reset_registry(registry: ToolRegistry = None):
     """Clear the tool registry - useful for testing."""
-    global _tools_registry
-    _tools_registry.clear()
+    (registry or _default_registry).reset()
@@ -4,6 +4,9 @@ This module provides a function-based show command tool for executing
 read-only show commands on network devices with enhanced validation.
 """
 
+from langchain_core.exceptions import OutputParserException
+from nornir.core.task import Result, Task
+from nornir_netmiko.connections import CONNECTION_NAME
 from nornir_netmiko.tasks import netmiko_send_command
 from pydantic import BaseModel, Field, field_validator
 
@@ -19,8 +22,11 @@ class ShowCommandInput(BaseModel):
     devices: list[str] = Field(
         description="List of device hostnames (e.g., ['sw1', 'sw2']). Must contain valid device names from inventory."
     )
-    command: str = Field(
-        description="The show command to execute (e.g., 'show ip int brief'). Must be a read-only command."
+    command: str | list[str] = Field(
+        description=(
+            "The show command to execute (e.g., 'show ip int brief'), or a list of show "
+            "commands to run in one session on the same devices. Must be read-only commands."
+        )
     )
 
     @field_validator('devices')
@@ -33,10 +39,35 @@ class ShowCommandInput(BaseModel):
     @field_validator('command')
     @classmethod
     def validate_command(cls, v):
-        """Validate command using ToolValidator."""
-        validated_command = ToolValidator.validate_command(v)
-        ToolValidator.validate_show_command_semantics(validated_command)
-        return validated_command
+        """Validate command(s) using ToolValidator."""
+        return _validate_show_commands(v)
+
+
+def _validate_show_commands(command: str | list[str]) -> str | list[str]:
+    """Validate a single show command or each command of a batch."""
+    if isinstance(command, list):
+        if not command:
+            raise OutputParserException("Command list cannot be empty.")
+        return [_validate_show_commands(c) for c in command]
+
+    validated_command = ToolValidator.validate_command(command)
+    ToolValidator.validate_show_command_semantics(validated_command)
+    return validated_command
+
+
+def send_commands(task: Task, commands: list[str], **kwargs) -> Result:
+    """Nornir task running several show commands over the host's one Netmiko session.
+
+    The commands are sent in this task's body rather than as subtasks, so a
+    failure surfaces the Netmiko exception itself for retry and error mapping.
+    Output is a list in command order, so repeated commands keep their own entry.
+    """
+    net_connect = task.host.get_connection(CONNECTION_NAME, task.nornir.config)
+    output = [
+        {"command": command, "output": net_connect.send_command(command, **kwargs)}
+        for command in commands
+    ]
+    return Result(host=task.host, result=output)
 
 
 @network_tool(
@@ -46,20 +77,21 @@ class ShowCommandInput(BaseModel):
         "Use for: viewing config, status, routing, ARP/MAC. "
         "REQUIREMENT: Use valid device names from inventory. "
         "REQUIREMENT: Command must be read-only (e.g., 'show', 'display'). "
+        "Pass a list of commands to run several shows on the same devices in one call. "
         "read-only operation. "
     ),
     schema=ShowCommandInput,
 )
 def show_command(
     devices: list[str],
-    command: str,
+    command: str | list[str],
     task_executor: TaskExecutor,
 ) -> str:
-    """Execute show command on specified devices.
+    """Execute show command(s) on specified devices.
 
     Args:
         devices: List of device hostnames to target
-        command: Show command to execute
+        command: Show command to execute, or a list run in one session per device
         task_executor: TaskExecutor instance for running tasks
 
     Returns:
@@ -67,15 +99,24 @@ def show_command(
     """
     # Additional validation beyond Pydantic field validators
     ToolValidator.validate_devices(devices)  # Validate devices list
-    command = ToolValidator.validate_command(command)
-    ToolValidator.validate_show_command_semantics(command)
+    command = _validate_show_commands(command)
 
     # Execute via task executor
-    results = task_executor.execute_task(
-        target_devices=devices,
-        task_function=netmiko_send_command,
-        command_string=command,
-    )
+    if isinstance(command, list):
+        # One task per device, so the connection check and session are shared by the batch
+        results = task_executor.execute_task(
+            target_devices=devices,
+            task_function=send_commands,
+            commands=command,
+            read_timeout=task_executor.read_timeout,
+        )
+    else:
+        results = task_executor.execute_task(
+            target_devices=devices,
+            task_function=netmiko_send_command,
+            command_string=command,
+            read_timeout=task_executor.read_timeout,
+        )
 
     # Process and return results
     return process_nornir_result(results, command=command)
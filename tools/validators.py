@@ -1,6 +1,7 @@
 """Centralized validation and error handling for tools."""
 
 import re
+from functools import lru_cache
 from typing import List
 
 from langchain_core.exceptions import OutputParserException
@@ -17,6 +18,21 @@ class ToolValidator:
     DEVICE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9._-]+$')
     SHOW_COMMAND_PATTERN = re.compile(r'^(show|display|sh)\s+[\w\s\-_\/\.]+$', re.IGNORECASE)
     CONFIG_COMMAND_PATTERN = re.compile(r'^[\w\s\-_\/\.]+$', re.IGNORECASE)
+    # Destructive operations, as one alternation so a command is scanned once
+    DANGEROUS_COMMAND_PATTERN = re.compile(
+        r'\b(?:delete|format|erase|clear counters|reload|reboot)\b'
+        r'|\bwrite\s+erase\b'
+        r'|\bcopy\s+.*\s+null\b'
+    )
+    SHOW_INDICATORS = ('show', 'display', 'sh', 'dir', 'ls')
+    # Config lines that can stop at a device prompt ([confirm], key size, yes/no)
+    INTERACTIVE_CONFIG_PATTERN = re.compile(
+        r'^(?:crypto\s+key\s+(?:generate|zeroize|import)'
+        r'|no\s+username\b'
+        r'|do\s+'
+        r'|license\s+)',
+        re.IGNORECASE,
+    )
 
     @staticmethod
     def validate_devices(devices: List[str]) -> None:
@@ -64,25 +80,27 @@ class ToolValidator:
         if not configs:
             raise OutputParserException("No configuration commands provided.")
 
-        # Clean: remove empty lines, trim whitespace
-        clean: List[str] = []
-        for config in configs:
-            for line in config.split("\n"):
-                line = line.strip()
-                if line:
-                    # Basic validation for configuration commands
-                    if not ToolValidator.CONFIG_COMMAND_PATTERN.match(line):
-                        raise OutputParserException(
-                            f"Invalid configuration command format: '{line}'. "
-                            "Configuration commands should contain valid network syntax."
-                        )
-                    clean.append(line)
+        # Clean: remove empty lines, trim whitespace (one splitlines pass over all input)
+        clean = [line for line in map(str.strip, "\n".join(configs).splitlines()) if line]
+
+        # Basic validation for configuration commands
+        for line in clean:
+            if not ToolValidator.CONFIG_COMMAND_PATTERN.match(line):
+                raise OutputParserException(
+                    f"Invalid configuration command format: '{line}'. "
+                    "Configuration commands should contain valid network syntax."
+                )
 
         if not clean:
             raise OutputParserException("No valid configuration commands after cleanup.")
 
         return clean
 
+    @staticmethod
+    def requires_interactive_prompt(configs: List[str]) -> bool:
+        """Return True if any config line may wait for an answer from the operator."""
+        return any(ToolValidator.INTERACTIVE_CONFIG_PATTERN.match(line) for line in configs)
+
     @staticmethod
     def validate_show_command_semantics(command: str) -> None:
         """Validate that the show command is semantically appropriate."""
@@ -92,17 +110,10 @@ class ToolValidator:
         command_lower = command.lower().strip()
 
         # Check for potentially dangerous or inappropriate commands
-        dangerous_patterns = [
-            r'\b(delete|format|erase|clear counters|reload|reboot)\b',
-            r'\bwrite\s+erase\b',
-            r'\bcopy\s+.*\s+null\b'
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command_lower):
-                raise OutputParserException(
-                    f"The command '{command}' appears to be a destructive operation that should be performed via the config_command tool, not the show_command tool."
-                )
+        if ToolValidator.DANGEROUS_COMMAND_PATTERN.search(command_lower):
+            raise OutputParserException(
+                f"The command '{command}' appears to be a destructive operation that should be performed via the config_command tool, not the show_command tool."
+            )
 
     @staticmethod
     def validate_config_command_semantics(configs: List[str]) -> None:
@@ -110,14 +121,17 @@ class ToolValidator:
         if not configs:
             return
 
-        for config in configs:
-            config_lower = config.lower()
+        # The schema and the tool body check the same configs, and replans resubmit them
+        ToolValidator._check_config_command_semantics(tuple(configs))
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _check_config_command_semantics(configs: tuple[str, ...]) -> None:
+        """Scan configs for show commands; only accepted configs end up cached."""
+        for config in configs:
             # Check for show commands in config context
-            show_indicators = ['show', 'display', 'sh', 'dir', 'ls']
-            for indicator in show_indicators:
-                if config_lower.startswith(indicator):
-                    raise OutputParserException(
-                        f"Configuration command '{config}' appears to be a show command. "
-                        "Use the show_command tool for read-only operations."
-                    )
+            if config.lower().startswith(ToolValidator.SHOW_INDICATORS):
+                raise OutputParserException(
+                    f"Configuration command '{config}' appears to be a show command. "
+                    "Use the show_command tool for read-only operations."
+                )
@@ -25,7 +25,8 @@ def success(devices: dict, **extra) -> str:
     Returns:
         JSON string with devices and metadata
     """
-    return json.dumps({"devices": devices, **extra}, indent=2)
+    # Compact output: the LLM reads this, so pretty-printing only costs CPU and tokens
+    return json.dumps({"devices": devices, **extra}, separators=(",", ":"))
 
 
 def to_json(data: dict) -> str: